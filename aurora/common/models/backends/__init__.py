@@ -1,5 +1,9 @@
+from .backend import Backend
 from .json import JSONBackend
+from .sqlite import SQLiteBackend
 
 __all__ = [
+    "Backend",
     "JSONBackend",
+    "SQLiteBackend",
 ]
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import contextlib
+import gc
+import json
+import typing as t
+from datetime import datetime
+from types import ModuleType
+
+from pydantic import BaseModel
+
+orjson: ModuleType | None
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+Path = t.Tuple[str, ...]
+
+
+class SchemaCodec():
+    """
+    A JSON codec for schema-modeled payloads.
+
+    Encoding maps sets to lists and datetimes to ISO 8601 strings, and
+    rejects any other non-JSON type. Decoding uses no object hooks;
+    instead, sets and datetimes are restored at the paths the schema
+    declares them. Payloads written with the legacy `{"set": ...}` and
+    `{"datetime": ...}` wrappers are restored as well.
+
+    `orjson` is used when installed, the standard `json` otherwise.
+
+    Attributes
+    ----------
+    `datetimes` : `tuple[Path, ...]`
+        The paths of datetime fields.
+    `sets` : `tuple[Path, ...]`
+        The paths of set fields.
+    """
+
+    def __init__(self, schema: type[BaseModel] | None = None) -> None:
+        """`SchemaCodec` constructor.
+
+        Parameters
+        ----------
+        `schema` : `type[BaseModel] | None`
+            The schema of the payload items, if any.
+        """
+        datetimes: list[Path] = []
+        sets: list[Path] = []
+        if schema is not None:
+            _collect_paths(schema, (), datetimes, sets)
+        self.datetimes = tuple(datetimes)
+        self.sets = tuple(sets)
+
+    def dumps(self, obj: object) -> str:
+        """Encode the object as a JSON string.
+
+        Parameters
+        ----------
+        `obj` : `object`
+            The object to encode.
+
+        Returns
+        -------
+        `str`
+            The JSON string.
+
+        Raises
+        ------
+        `TypeError`
+            If the object holds non-JSON types other than sets and
+            datetimes.
+        """
+        if orjson is not None:
+            return orjson.dumps(obj, default=_default).decode()
+        return json.dumps(obj, default=_default)
+
+    def loads(self, text: str | bytes) -> t.Any:
+        """Decode the JSON string, without restoring any types.
+
+        Garbage collection is paused while decoding. Decoded JSON holds
+        no reference cycles, but allocating its many containers would
+        otherwise trigger repeated collections of the whole heap.
+
+        Parameters
+        ----------
+        `text` : `str | bytes`
+            The JSON string.
+
+        Returns
+        -------
+        `Any`
+            The decoded object.
+        """
+        with _paused_gc():
+            if orjson is not None:
+                return orjson.loads(text)
+            return json.loads(text)
+
+    def restore(self, item: dict) -> dict:
+        """Restore the schema's sets and datetimes of the item in place.
+
+        Parameters
+        ----------
+        `item` : `dict`
+            A decoded payload item.
+
+        Returns
+        -------
+        `dict`
+            The restored item.
+        """
+        for path in self.datetimes:
+            _convert(item, path, _to_datetime)
+        for path in self.sets:
+            _convert(item, path, _to_set)
+        return item
+
+
+@contextlib.contextmanager
+def _paused_gc() -> t.Iterator[None]:
+    """Pause garbage collection, unless already paused."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _default(obj: object) -> t.Any:
+    """Encode the non-JSON types of the schemas."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+def _collect_paths(
+    schema: type[BaseModel],
+    prefix: Path,
+    datetimes: list[Path],
+    sets: list[Path],
+) -> None:
+    """Collect the paths of the datetime and set fields of the schema."""
+
+    fields = getattr(schema, "model_fields", None) or schema.__fields__
+    hints = t.get_type_hints(schema)
+
+    for name in fields:
+        hint = _unwrap_optional(hints[name])
+        path = (*prefix, name)
+        if hint is datetime:
+            datetimes.append(path)
+        elif (t.get_origin(hint) or hint) in (set, frozenset):
+            sets.append(path)
+        elif isinstance(hint, type) and issubclass(hint, BaseModel):
+            _collect_paths(hint, path, datetimes, sets)
+
+
+def _unwrap_optional(hint: t.Any) -> t.Any:
+    """Return `X` of `Optional[X]`, the hint itself otherwise."""
+    none = type(None)
+    args = [arg for arg in t.get_args(hint) if arg is not none]
+    if none in t.get_args(hint) and len(args) == 1:
+        return args[0]
+    return hint
+
+
+def _convert(item: dict, path: Path, function: t.Callable) -> None:
+    """Apply the function to the value at the path, if present."""
+    *parents, name = path
+    node: t.Any = item
+    for parent in parents:
+        node = node.get(parent)
+        if not isinstance(node, dict):
+            return
+    if node.get(name) is not None:
+        node[name] = function(node[name])
+
+
+def _to_datetime(value: t.Any) -> datetime:
+    """Return the datetime of an ISO or legacy-wrapped string."""
+    if isinstance(value, dict):
+        value = value["datetime"]
+    return datetime.fromisoformat(value)
+
+
+def _to_set(value: t.Any) -> set:
+    """Return the set of a list or legacy-wrapped list."""
+    if isinstance(value, dict):
+        value = value["set"]
+    return set(value)
@@ -1,29 +1,76 @@
-import json
+from __future__ import annotations
+
+import os
+from datetime import datetime
 from pathlib import Path
 
+from pydantic import BaseModel
+
 from .backend import Backend
-from .utils import PyObjEncoder, as_python_object
+from .codec import SchemaCodec
 
 
 class JSONBackend(Backend):
     """
     A JSON backend.
 
+    The payload is stored as a JSON snapshot file, always replaced
+    atomically, such that a crash mid-write never truncates it.
+
+    In journal mode, saves only append the changed items (upserts and
+    deletes, identified by `key`) to a log next to the snapshot. The log
+    is replayed on fetch, and compacted into a new snapshot once it
+    reaches `compact_every` entries.
+
     Attributes
     ----------
     `filename` : str
         The associated JSON filename.
+    `journal` : `bool`
+        Whether saves are journaled.
+    `key` : `str`
+        The field identifying journaled items.
+    `compact_every` : `int`
+        The number of log entries triggering compaction.
+    `codec` : `SchemaCodec`
+        The JSON codec of the payload.
     """
 
-    def __init__(self, data_dir: str, filename: str) -> None:
+    def __init__(
+        self,
+        data_dir: str,
+        filename: str,
+        journal: bool = False,
+        key: str = "id",
+        compact_every: int = 1000,
+        schema: type[BaseModel] | None = None,
+    ) -> None:
         """Initialize the backend with the JSON filename.
 
         Parameters
         ----------
         `filename` : `str`
             The JSON filename to associate with this instance.
+        `journal` : `bool`
+            Whether saves are journaled, `False` by default.
+        `key` : `str`
+            The field identifying journaled items, `"id"` by default.
+        `compact_every` : `int`
+            The number of log entries triggering compaction, 1000 by
+            default.
+        `schema` : `type[BaseModel] | None`
+            The schema of the payload items, restoring their non-JSON
+            types on fetch.
         """
         self.path = f"{data_dir}/{filename}"
+        self.log_path = f"{self.path}.log"
+        self.journal = journal
+        self.key = key
+        self.compact_every = compact_every
+        self.codec = SchemaCodec(schema)
+        self.__items: dict = {}
+        self.__loaded = False
+        self.__entries = 0
 
     def init(self):
         """docstring"""
@@ -34,29 +81,189 @@ class JSONBackend(Backend):
     def fetch(self):
         """Return the contents of the associated JSON file.
 
+        In journal mode, the logged changes are applied to the snapshot.
+        A snapshot (or log) that fails to load is set aside, rather than
+        later overwritten.
+
         Returns
         -------
         `JsonType`
             The contents of the associated JSON file as a
             JSON object or list of JSON objects.
         """
+
         try:
-            with open(self.path) as handle:
-                return json.load(handle, object_hook=as_python_object)
+            with open(self.path, "rb") as handle:
+                payload = self.codec.loads(handle.read())
         except Exception as err:
             print(err)  # TODO log, don't print
-            return []
+            self._set_aside(self.path)
+            payload = []
+
+        if isinstance(payload, list):
+            payload = [self.codec.restore(item) for item in payload]
+
+        if not self.journal:
+            return payload
+
+        self.__items = {item[self.key]: item for item in payload}
+        self.__loaded = True
+        self.__entries = self._replay()
+
+        return list(self.__items.values())
 
     def save(self, payload: object) -> None:
         """Override the associated JSON file with the payload.
 
+        In journal mode, only the changes since the last fetch/save are
+        appended to the log.
+
         Parameters
         ----------
         `payload` : `object`
             A JSON serializable data object.
         """
         try:
-            with open(self.path, "w+") as handle:
-                json.dump(payload, handle, cls=PyObjEncoder)
+            if self.journal and isinstance(payload, list):
+                self._append(payload)
+            else:
+                self._write_snapshot(payload)
         except Exception as err:
             print(err)  # TODO log, don't print
+
+    def compact(self) -> None:
+        """Fold the log into a new snapshot and clear the log.
+
+        Does nothing if saves are not journaled.
+        """
+        if not self.journal:
+            return
+        if not self.__loaded:
+            self.fetch()
+        self._write_snapshot(list(self.__items.values()))
+        with open(self.log_path, "w"):
+            pass
+        self.__entries = 0
+
+    ###########
+    # PRIVATE #
+    ###########
+
+    def _append(self, payload: list[dict]) -> None:
+        """Append the changes of the payload to the log.
+
+        Items are compared by reference first, as the models replace
+        rather than modify the items of their payloads.
+
+        Parameters
+        ----------
+        `payload` : `list[dict]`
+            The full list of items.
+        """
+
+        if not self.__loaded:
+            self.fetch()
+
+        items = {item[self.key]: item for item in payload}
+
+        entries: list[dict] = []
+
+        for key, item in items.items():
+            old = self.__items.get(key)
+            if old is not item and old != item:
+                entries.append({"upsert": item})
+
+        for key in self.__items.keys() - items.keys():
+            entries.append({"delete": key})
+
+        if entries:
+            with open(self.log_path, "ab+") as handle:
+                # terminate an entry left unterminated by a failed append
+                if handle.seek(0, os.SEEK_END):
+                    handle.seek(-1, os.SEEK_END)
+                    if handle.read(1) != b"\n":
+                        handle.write(b"\n")
+                for entry in entries:
+                    handle.write(f"{self.codec.dumps(entry)}\n".encode())
+                handle.flush()
+                os.fsync(handle.fileno())
+
+        self.__items = items
+        self.__entries += len(entries)
+
+        if self.__entries >= self.compact_every:
+            self.compact()
+
+    def _replay(self) -> int:
+        """Apply the logged changes to the fetched items.
+
+        An unterminated, unreadable last entry (from an interrupted
+        append) is cut from the log. Any other unreadable entry is
+        skipped, and the log set aside and compacted into a snapshot
+        of the readable entries.
+
+        Returns
+        -------
+        `int`
+            The number of log entries left to compact.
+        """
+
+        if not Path(self.log_path).exists():
+            return 0
+
+        entries = 0
+        offset = 0
+        corrupt = False
+
+        with open(self.log_path, "rb+") as handle:
+            for line in handle:
+                try:
+                    entry = self.codec.loads(line)
+                except ValueError:
+                    if not line.endswith(b"\n"):
+                        handle.truncate(offset)
+                        break
+                    corrupt = True
+                    offset += len(line)
+                    continue
+                if "upsert" in entry:
+                    item = self.codec.restore(entry["upsert"])
+                    self.__items[item[self.key]] = item
+                else:
+                    self.__items.pop(entry["delete"], None)
+                offset += len(line)
+                entries += 1
+
+        if corrupt:
+            self._set_aside(self.log_path)
+            self.compact()
+            return 0
+
+        return entries
+
+    def _write_snapshot(self, payload: object) -> None:
+        """Atomically replace the snapshot with the payload.
+
+        Parameters
+        ----------
+        `payload` : `object`
+            A JSON serializable data object.
+        """
+        temp = f"{self.path}.tmp"
+        with open(temp, "w") as handle:
+            handle.write(self.codec.dumps(payload))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp, self.path)
+
+    def _set_aside(self, path: str) -> None:
+        """Rename an unreadable file, preserving it for recovery.
+
+        Parameters
+        ----------
+        `path` : `str`
+            The snapshot or log path.
+        """
+        if Path(path).exists():
+            timestamp = datetime.now().strftime(r"%Y%m%d-%H%M%S")
+            os.replace(path, f"{path}.corrupt-{timestamp}")
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from contextlib import closing
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+from .backend import Backend
+from .codec import SchemaCodec
+
+TABLE = "items"
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteBackend(Backend):
+    """
+    A SQLite backend.
+
+    Items are stored as JSON documents in a single table, keyed by
+    `key`. The fields listed in `columns` (dotted paths into the items)
+    are additionally stored in indexed columns, such that `query` can
+    filter in SQL rather than in memory.
+
+    Saves only write the items that changed since the last fetch/save,
+    in a single transaction.
+
+    Attributes
+    ----------
+    `path` : `str`
+        The database path.
+    `key` : `str`
+        The field identifying items.
+    `columns` : `tuple[str, ...]`
+        The indexed fields.
+    `codec` : `SchemaCodec`
+        The JSON codec of the items.
+    """
+
+    def __init__(
+        self,
+        data_dir: str,
+        filename: str,
+        key: str = "id",
+        columns: Iterable[str] = (),
+        schema: type[BaseModel] | None = None,
+    ) -> None:
+        """`SQLiteBackend` constructor.
+
+        Parameters
+        ----------
+        `data_dir` : `str`
+            The data directory.
+        `filename` : `str`
+            The database filename.
+        `key` : `str`
+            The field identifying items, `"id"` by default.
+        `columns` : `Iterable[str]`
+            The dotted paths of the fields to index.
+        `schema` : `type[BaseModel] | None`
+            The schema of the items, restoring their non-JSON types on
+            fetch.
+        """
+        self.path = f"{data_dir}/{filename}"
+        self.key = key
+        self.columns = tuple(dict.fromkeys(columns))
+        self.codec = SchemaCodec(schema)
+        self.__items: dict = {}
+        self.__loaded = False
+
+    def init(self) -> None:
+        """Create the table and its indexes, unless present."""
+
+        columns = "".join(f', "{column}"' for column in self.columns)
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(f"""
+                CREATE TABLE IF NOT EXISTS {TABLE} (
+                    key PRIMARY KEY,
+                    body TEXT NOT NULL{columns}
+                )
+            """)
+            for index, column in enumerate(self.columns):
+                connection.execute(f"""
+                    CREATE INDEX IF NOT EXISTS {TABLE}_{index}
+                    ON {TABLE} ("{column}")
+                """)
+
+    def fetch(self) -> list[dict]:
+        """Return all stored items.
+
+        Returns
+        -------
+        `list[dict]`
+            The stored items, in insertion order.
+        """
+
+        try:
+            with closing(self._connect()) as connection:
+                rows = connection.execute(
+                    f"SELECT body FROM {TABLE} ORDER BY rowid").fetchall()
+        except sqlite3.Error as err:
+            logger.error("failed to fetch from %s: %s", self.path, err)
+            self.__items = {}
+            return []
+
+        items = [self._decode(body) for body, in rows]
+        self.__items = {item[self.key]: item for item in items}
+        self.__loaded = True
+
+        return items
+
+    def save(self, payload: object) -> None:
+        """Persist the payload, writing only changed items.
+
+        Items are compared by reference first, as the models replace
+        rather than modify the items of their payloads.
+
+        Parameters
+        ----------
+        `payload` : `object`
+            The full list of items.
+
+        Raises
+        ------
+        `TypeError`
+            If the payload is not a list of items.
+        """
+
+        if not isinstance(payload, list):
+            raise TypeError("payload must be a list of items")
+
+        if not self.__loaded:
+            self.fetch()
+
+        items = {item[self.key]: item for item in payload}
+
+        changed: list[dict] = []
+
+        for key, item in items.items():
+            old = self.__items.get(key)
+            if old is not item and old != item:
+                changed.append(item)
+
+        deleted = list(self.__items.keys() - items.keys())
+
+        try:
+            with closing(self._connect()) as connection, connection:
+                self._upsert(connection, changed)
+                self._delete(connection, deleted)
+        except sqlite3.Error as err:
+            logger.error("failed to save to %s: %s", self.path, err)
+            return
+
+        self.__items = items
+
+    def upsert(self, items: list[dict]) -> None:
+        """Insert or replace items.
+
+        Parameters
+        ----------
+        `items` : `list[dict]`
+            The items to write.
+        """
+        with closing(self._connect()) as connection, connection:
+            self._upsert(connection, items)
+        if self.__loaded:
+            self.__items.update((item[self.key], item) for item in items)
+
+    def delete(self, keys: list[Any]) -> None:
+        """Delete items.
+
+        Parameters
+        ----------
+        `keys` : `list[Any]`
+            The keys of the items to delete.
+        """
+        with closing(self._connect()) as connection, connection:
+            self._delete(connection, keys)
+        if self.__loaded:
+            for key in keys:
+                self.__items.pop(key, None)
+
+    def query(self, query: dict[str, Any]) -> list[dict]:
+        """Return the items matching the query.
+
+        Parameters
+        ----------
+        `query` : `dict[str, Any]`
+            A mapping of indexed fields (or the key) to a value, or to a
+            list/set/tuple of accepted values.
+
+        Returns
+        -------
+        `list[dict]`
+            The matching items, in insertion order.
+
+        Raises
+        ------
+        `ValueError`
+            If a queried field is not indexed.
+        """
+
+        clauses: list[str] = []
+        params: list[Any] = []
+
+        for field, value in query.items():
+            if field == self.key:
+                column = "key"
+            elif field in self.columns:
+                column = f'"{field}"'
+            else:
+                raise ValueError(f"'{field}' is not an indexed field")
+
+            if isinstance(value, (list, set, tuple)):
+                values = list(value)
+                marks = ", ".join("?" * len(values))
+                clauses.append(f"{column} IN ({marks})")
+                params.extend(values)
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                f"SELECT body FROM {TABLE} {where} ORDER BY rowid",
+                params,
+            ).fetchall()
+
+        return [self._decode(body) for body, in rows]
+
+    ###########
+    # PRIVATE #
+    ###########
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return a new connection to the database."""
+        return sqlite3.connect(self.path)
+
+    def _upsert(
+        self,
+        connection: sqlite3.Connection,
+        items: list[dict],
+    ) -> None:
+        """Insert or replace items within the connection's transaction."""
+
+        columns = ["body", *(f'"{column}"' for column in self.columns)]
+        names = ", ".join(("key", *columns))
+        marks = ", ".join("?" * (len(columns) + 1))
+        updates = ", ".join(f"{name} = excluded.{name}" for name in columns)
+
+        connection.executemany(
+            f"""
+            INSERT INTO {TABLE} ({names}) VALUES ({marks})
+            ON CONFLICT (key) DO UPDATE SET {updates}
+            """,
+            [self._to_row(item) for item in items],
+        )
+
+    def _delete(
+        self,
+        connection: sqlite3.Connection,
+        keys: list[Any],
+    ) -> None:
+        """Delete items within the connection's transaction."""
+        connection.executemany(
+            f"DELETE FROM {TABLE} WHERE key = ?",
+            [(key, ) for key in keys],
+        )
+
+    def _to_row(self, item: dict) -> tuple:
+        """Return the table row of the item."""
+        body = self.codec.dumps(item)
+        values = (self._get_field(item, column) for column in self.columns)
+        return (item[self.key], body, *values)
+
+    @staticmethod
+    def _get_field(item: dict, path: str) -> Any:
+        """Return the value at the dotted path, `None` if missing."""
+        value: Any = item
+        for part in path.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value if isinstance(value, (str, int, float)) else None
+
+    def _decode(self, body: str) -> dict:
+        """Return the item of the JSON document."""
+        return self.codec.restore(self.codec.loads(body))
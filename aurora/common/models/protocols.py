@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Mapping
+
 from aiida_aurora.schemas.cycling import CyclingTechnique, ElectroChemSequence
 from traitlets import HasTraits, Integer
 
 from aurora.common.models.backends.backend import Backend
-from aurora.common.models.utils import get_valid
+from aurora.common.models.utils import validate
 
 
 class ProtocolsModel(HasTraits):
@@ -19,8 +23,8 @@ class ProtocolsModel(HasTraits):
         An observable protocols update counter.
     `raw` : `List[dict]`
         The list of validated protocol dictionaries.
-    `models` : `List[ElectroChemSequence]`
-        The list of validated protocol models.
+    `models` : `Mapping[str, ElectroChemSequence]`
+        The read-only mapping of validated protocol models.
     """
 
     updated = Integer(0)
@@ -35,6 +39,7 @@ class ProtocolsModel(HasTraits):
         """
         self.__backend = backend
         self.__raw: dict[str, dict] = {}
+        self.__models: dict[str, ElectroChemSequence] = {}
 
         if self.__backend:
             self.__backend.init()
@@ -54,30 +59,45 @@ class ProtocolsModel(HasTraits):
     def raw(self, protocols: list[dict]) -> None:
         """Validate protocols and store as dictionary.
 
+        Protocols identical to those already stored are not revalidated.
+
         Parameters
         ----------
         `protocols` : `List[dict]`
             The raw protocols to be validated and stored.
         """
-        self.__raw = {
-            protocol.name: protocol.dict()
-            for protocol in get_valid(protocols, schema=ElectroChemSequence)
-        }
+
+        raw: dict[str, dict] = {}
+        models: dict[str, ElectroChemSequence] = {}
+
+        for protocol in protocols:
+            name = protocol.get("name")
+            if isinstance(name, str) and self.__raw.get(name) == protocol:
+                raw[name] = self.__raw[name]
+                models[name] = self.__models[name]
+                continue
+            valid = validate(protocol, schema=ElectroChemSequence)
+            if isinstance(valid, ElectroChemSequence):
+                raw[valid.name] = valid.dict()
+                models[valid.name] = valid
+
+        self.__raw = raw
+        self.__models = models
         self.updated += 1
 
     @property
-    def models(self) -> dict[str, ElectroChemSequence]:
+    def models(self) -> Mapping[str, ElectroChemSequence]:
         """Return the validated protocol models.
 
+        The models are validated once, when stored, and must not be
+        modified. Copy a protocol before editing it.
+
         Returns
         -------
-        `Dict[str, ElectroChemSequence]`
-            A `{name: protocol}` dictionary of validated protocols.
+        `Mapping[str, ElectroChemSequence]`
+            A read-only `{name: protocol}` mapping of validated protocols.
         """
-        return {
-            protocol.name: protocol
-            for protocol in get_valid(self.raw, schema=ElectroChemSequence)
-        }
+        return MappingProxyType(self.__models)
 
     def set_backend(self, backend: Backend) -> None:
         """Set this model's backend.
@@ -101,7 +121,7 @@ class ProtocolsModel(HasTraits):
 
     def get_protocol(self, name: str) -> ElectroChemSequence | None:
         """docstring"""
-        return self.models.get(name)
+        return self.__models.get(name)
 
     def update(self, protocol: ElectroChemSequence, save=True) -> None:
         """Update protocol (persisted).
@@ -116,6 +136,8 @@ class ProtocolsModel(HasTraits):
             If the samples are to be persisted after operation.
         """
         self.__raw[protocol.name] = protocol.dict()
+        # snapshot, as the editor keeps modifying its instance
+        self.__models[protocol.name] = deepcopy(protocol)
         self.updated += 1
         if save:
             self.save()
@@ -151,6 +173,7 @@ class ProtocolsModel(HasTraits):
         if protocol_name not in self.__raw:
             raise KeyError(f"protocol {protocol_name} does not exist.")
         del self.__raw[protocol_name]
+        del self.__models[protocol_name]
         self.updated += 1
         if save:
             self.save()
@@ -180,12 +203,17 @@ class ProtocolsModel(HasTraits):
     def sync(self, other: ProtocolsModel) -> None:
         """Synchronize this model with another.
 
+        The other model's protocols are already validated, and are
+        shared rather than revalidated.
+
         Parameters
         ----------
         `other` : `ProtocolsModel`
             Another instance of this class against which to sync.
         """
-        self.raw = other.raw
+        self.__raw = dict(other.__raw)
+        self.__models = dict(other.__models)
+        self.updated += 1
 
     def query(
         self,
@@ -205,8 +233,8 @@ class ProtocolsModel(HasTraits):
         `List[ElectroChemSequence]`
             A list of protocols.
         """
-        return list(self.models.values()) if names is None \
-            else [self.models[name] for name in names]
+        return list(self.__models.values()) if names is None \
+            else [self.__models[name] for name in names]
 
     def display(self, protocol: CyclingTechnique) -> None:
         """Display details of the `protocol`.
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import contextlib
+from types import MappingProxyType
+from typing import Any, Mapping
 
+import numpy as np
 import pandas as pd
 from aiida.orm import Group, load_group
 from aiida_aurora.schemas.battery import BatterySample, BatterySampleJsonTypes
@@ -10,7 +13,7 @@ from traitlets import HasTraits, Integer
 
 from ..groups import SAMPLES_GROUP_PREFIX as GROUP_PREFIX
 from .backends.backend import Backend
-from .utils import get_valid, style, to_pd_query
+from .utils import read_only, style, validate
 
 Types: dict = BatterySampleJsonTypes
 
@@ -21,7 +24,15 @@ class SamplesModel(HasTraits):
     """A model used in Aurora to manage available samples.
 
     Available samples are loaded in from the associated backend
-    and stored locally as a queryable `pandas` dataframe.
+    and stored locally as a queryable `pandas` dataframe. Queried
+    fields are indexed on first use (value -> row positions), such that
+    each condition resolves to a row mask without scanning the field,
+    and filter combinations resolve by mask intersection. Indexes are
+    discarded whenever the dataframe changes.
+
+    The dataframe is held on read-only arrays and is never modified in
+    place. Mutations replace it, copying only the changed columns, such
+    that views of it are consistent snapshots that need not be copied.
 
     Attributes
     ----------
@@ -34,7 +45,9 @@ class SamplesModel(HasTraits):
     `models` : `list[BatterySample]`
         The list of validated sample models.
     `samples` : `pd.DataFrame`
-        The local cache of available samples.
+        A copy of the local cache of available samples.
+    `view` : `pd.DataFrame`
+        A read-only view of the local cache of available samples.
     """
 
     OPTIONS = {
@@ -59,7 +72,9 @@ class SamplesModel(HasTraits):
         """
         self.__backend = backend
         self.__raw: dict[int, dict] = {}
+        self.__models: dict[int, BatterySample] = {}
         self.__cache = pd.DataFrame()
+        self.__indexes: dict[str, dict[Any, np.ndarray]] = {}
 
         if self.__backend:
             self.__backend.init()
@@ -90,29 +105,43 @@ class SamplesModel(HasTraits):
     def raw(self, samples: list[dict]) -> None:
         """Validate samples and store as dictionary.
 
+        Samples identical to those already stored are not revalidated.
+
         Parameters
         ----------
         `samples` : `list[dict]`
             The raw samples to be validated and stored.
         """
-        self.__raw = {
-            sample.id: sample.dict()
-            for sample in get_valid(samples, schema=BatterySample)
-        }
+
+        raw: dict[int, dict] = {}
+        models: dict[int, BatterySample] = {}
+
+        for sample in samples:
+            sid = sample.get("id")
+            if isinstance(sid, int) and self.__raw.get(sid) == sample:
+                raw[sid] = self.__raw[sid]
+                models[sid] = self.__models[sid]
+                continue
+            valid = validate(sample, schema=BatterySample)
+            if isinstance(valid, BatterySample):
+                raw[valid.id] = valid.dict()
+                models[valid.id] = valid
+
+        self.__raw = raw
+        self.__models = models
 
     @property
-    def models(self) -> dict[int, BatterySample]:
+    def models(self) -> Mapping[int, BatterySample]:
         """Return the validated sample models.
 
+        The models are validated once, when stored.
+
         Returns
         -------
-        `dict[int, BatterySample]`
-            A list of validated sample models.
+        `Mapping[int, BatterySample]`
+            A read-only mapping of ids to validated sample models.
         """
-        return {
-            sample.id: sample
-            for sample in get_valid(self.raw, schema=BatterySample)
-        }
+        return MappingProxyType(self.__models)
 
     @property
     def samples(self) -> pd.DataFrame:
@@ -125,9 +154,7 @@ class SamplesModel(HasTraits):
         `pd.DataFrame`
             The samples dataframe cache.
         """
-        if self.__raw and not self.has_samples():
-            self.cache()
-        return self.__cache.copy(deep=True)
+        return self.view.copy(deep=True)
 
     @samples.setter
     def samples(self, samples: pd.DataFrame) -> None:
@@ -138,7 +165,25 @@ class SamplesModel(HasTraits):
         `samples` : `pd.DataFrame`
             A samples dataframe.
         """
-        self.__cache = samples
+        self.__cache = read_only(samples)
+        self.__indexes.clear()
+
+    @property
+    def view(self) -> pd.DataFrame:
+        """Return a read-only view of the samples dataframe.
+
+        The view shares the model's read-only arrays, such that writing
+        into it raises a `ValueError`. Use `samples` for a modifiable
+        copy.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            A view of the samples dataframe cache.
+        """
+        if self.__raw and not self.has_samples():
+            self.cache()
+        return self.__cache.copy(deep=False)
 
     @property
     def highest_sample_id(self) -> int:
@@ -204,7 +249,9 @@ class SamplesModel(HasTraits):
         `pd.DataFrame`
             The `pd.DataFrame` sample row.
         """
-        return self.query({"id": sample_id})
+        if sample_id not in self.__cache.index:
+            return self.__cache.iloc[:0].copy()
+        return self.__cache.loc[[sample_id]].copy()
 
     def get_group_labels(self, discard="") -> list[str]:
         """Fetch group labels from cache.
@@ -237,9 +284,10 @@ class SamplesModel(HasTraits):
         `set[int]`
             The set of samples assigned to the given group.
         """
-        column = "metadata.groups"
-        condition = self.__cache[column].apply(lambda groups: group in groups)
-        return set(self.__cache[condition].index)
+        if not self.has_samples():
+            return set()
+        rows = self.__get_index("metadata.groups").get(group)
+        return set() if rows is None else set(self.__cache.index[rows])
 
     def save_group(self, ids: list[int], group: str) -> None:
         """Save group by attaching its label to selected samples.
@@ -270,8 +318,9 @@ class SamplesModel(HasTraits):
             The group label.
         """
         rows, column = ids or slice(None), "metadata.groups"
-        self.__cache.loc[rows, column] = self.__cache.loc[rows, column].apply(
-            lambda groups: groups | {group})
+        current = self.__cache.loc[rows, column]
+        groups = current.apply(lambda groups: groups | {group})
+        self.__set_column(column, rows, groups)
 
     def remove_from_group(self, ids: list[int], group: str) -> None:
         """Remove selected samples from group.
@@ -284,8 +333,9 @@ class SamplesModel(HasTraits):
             The group label.
         """
         rows, column = ids or slice(None), "metadata.groups"
-        self.__cache.loc[rows, column] = self.__cache.loc[rows, column].apply(
-            lambda groups: groups - {group})
+        current = self.__cache.loc[rows, column]
+        groups = current.apply(lambda groups: groups - {group})
+        self.__set_column(column, rows, groups)
 
     def get_aiida_groups(self) -> list[Group]:
         """docstring"""
@@ -326,7 +376,7 @@ class SamplesModel(HasTraits):
         `subbatch` : `str`
             The sub-batch label.
         """
-        self.__cache.loc[ids, "metadata.subbatch"] = subbatch
+        self.__set_column("metadata.subbatch", ids, subbatch)
         self.updated += 1
 
     def load(self) -> None:
@@ -352,15 +402,8 @@ class SamplesModel(HasTraits):
         Caching also increments the `new_data_trigger` observable.
         """
 
-        df = pd.json_normalize(self.raw)
-
-        if not df.empty:
-            df = df.astype({c: t for c, t in Types.items() if c in df})
-            df.set_index("id", drop=True, inplace=True)
-            key = "metadata.creation_datetime"
-            df[key] = pd.to_datetime(df[key])
-
-        self.__cache = df
+        self.__cache = read_only(self.__normalize(self.raw))
+        self.__indexes.clear()
         self.updated += 1
 
     def update(self, sample: BatterySample, cache=True, save=True) -> None:
@@ -378,8 +421,9 @@ class SamplesModel(HasTraits):
             If the samples are to be persisted after operation.
         """
         self.__raw[sample.id] = sample.dict()
+        self.__models[sample.id] = sample
         if cache:
-            self.cache()
+            self.__cache_rows([sample.id])
         if save:
             self.save()
 
@@ -423,7 +467,7 @@ class SamplesModel(HasTraits):
         for sample in samples:
             self.add(sample, cache=False, save=False)
         if cache:
-            self.cache()
+            self.__cache_rows([sample.id for sample in samples])
         if save:
             self.save()
 
@@ -444,8 +488,9 @@ class SamplesModel(HasTraits):
         if sample_id not in self.__raw:
             raise KeyError(f"sample {sample_id} does not exist.")
         del self.__raw[sample_id]
+        del self.__models[sample_id]
         if cache:
-            self.cache()
+            self.__drop_rows([sample_id])
         if save:
             self.save()
 
@@ -471,7 +516,7 @@ class SamplesModel(HasTraits):
         for sid in sample_ids:
             self.delete(sid, cache=False, save=False)
         if cache:
-            self.cache()
+            self.__drop_rows(sample_ids)
         if save:
             self.save()
 
@@ -500,12 +545,16 @@ class SamplesModel(HasTraits):
     def sync(self, other: SamplesModel) -> None:
         """Synchronize this model with another.
 
+        The other model's samples are already validated, and are shared
+        rather than revalidated.
+
         Parameters
         ----------
         `other` : `SamplesModel`
             Another instance of this class against which to sync.
         """
-        self.raw = other.raw
+        self.__raw = dict(other.__raw)
+        self.__models = dict(other.__models)
         self.cache()
 
     def query(
@@ -529,25 +578,70 @@ class SamplesModel(HasTraits):
         Returns
         -------
         `pd.DataFrame`
-            A dataframe of available samples, optionally filtered.
+            A read-only dataframe of available samples, optionally
+            filtered.
         """
 
         if not self.has_samples():
             return self.__cache
 
-        df = self.samples
-        if group := query.pop("group", None):
-            field = "metadata.groups"
-            df = df[df[field].apply(lambda groups: group in groups)]
+        df = self.__cache
 
-        pd_query = to_pd_query(query) or "id"
-        results = df.query(pd_query)
+        masks = self.__get_masks(query).values()
+        mask = np.logical_and.reduce(list(masks)) if masks else None
+
+        results = df.copy(deep=False) if mask is None else df[mask]
 
         if not project or results.empty:
             return results
 
         return self._project_results(results, project)
 
+    def get_facets(
+        self,
+        query: dict,
+        fields: list[str],
+    ) -> dict[str, list[tuple[Any, int]]]:
+        """Return the per-value sample counts of the given fields.
+
+        Each field's counts are those of the samples matching all query
+        conditions except the field's own, such that they reflect the
+        effect of changing the field's selection. Conditions are
+        resolved once and shared across fields.
+
+        Parameters
+        ----------
+        `query` : `dict`
+            A dictionary of query conditions.
+        `fields` : `list[str]`
+            The fields for which to count samples.
+
+        Returns
+        -------
+        `dict[str, list[tuple[Any, int]]]`
+            The `(value, count)` pairs of each field, covering all of
+            the field's values in order of appearance.
+        """
+
+        if not self.has_samples():
+            return {field: [] for field in fields}
+
+        masks = self.__get_masks(query)
+
+        facets: dict[str, list[tuple[Any, int]]] = {}
+
+        for field in fields:
+
+            others = [mask for key, mask in masks.items() if key != field]
+            mask = np.logical_and.reduce(others) if others else None
+
+            facets[field] = [
+                (value, len(rows) if mask is None else int(mask[rows].sum()))
+                for value, rows in self.__get_index(field).items()
+            ]
+
+        return facets
+
     def display(self, df: pd.DataFrame) -> None:
         """Display a styled samples dataframe.
 
@@ -631,10 +725,198 @@ class SamplesModel(HasTraits):
 
         return results[project]
 
+    def __normalize(self, samples: list[dict]) -> pd.DataFrame:
+        """Flatten and type sample dictionaries as dataframe rows.
+
+        Parameters
+        ----------
+        `samples` : `list[dict]`
+            The sample dictionaries.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The typed dataframe rows, indexed by sample id.
+        """
+
+        df = pd.json_normalize(samples)
+
+        if not df.empty:
+            df = df.astype({c: t for c, t in Types.items() if c in df})
+            df.set_index("id", drop=True, inplace=True)
+            key = "metadata.creation_datetime"
+            df[key] = pd.to_datetime(df[key])
+
+        return df
+
+    def __cache_rows(self, ids: list[int]) -> None:
+        """Insert or replace the rows of the given samples.
+
+        Only the given samples are normalized. Replaced rows keep their
+        position and new rows are appended, as with a full re-cache.
+        Each column is copied once, without re-indexing the dataframe.
+
+        Parameters
+        ----------
+        `ids` : `list[int]`
+            The ids of the new or updated samples.
+        """
+
+        if not self.has_samples():
+            self.cache()
+            return
+
+        rows = self.__normalize([self.__raw[id] for id in ids])
+        rows = rows[~rows.index.duplicated(keep="last")]
+
+        df = self.__cache
+        if set(rows.columns) != set(df.columns):
+            self.cache()
+            return
+
+        positions = df.index.get_indexer(rows.index)
+        replaced = positions >= 0
+
+        columns = {}
+        for column in df.columns:
+            new = rows[column].to_numpy()
+            values = np.concatenate([df[column].to_numpy(), new[~replaced]])
+            values[positions[replaced]] = new[replaced]
+            values.flags.writeable = False
+            columns[column] = values
+
+        index = df.index.append(rows.index[~replaced])
+        df = pd.DataFrame(columns, index=index, copy=False)
+
+        self.__cache = read_only(df)
+        self.__indexes.clear()
+        self.updated += 1
+
+    def __drop_rows(self, ids: list[int]) -> None:
+        """Drop the rows of the given samples.
+
+        Parameters
+        ----------
+        `ids` : `list[int]`
+            The ids of the deleted samples.
+        """
+        df = self.__cache
+        keep = ~df.index.isin(ids)
+
+        columns = {}
+        for column in df.columns:
+            values = df[column].to_numpy()[keep]
+            values.flags.writeable = False
+            columns[column] = values
+
+        df = pd.DataFrame(columns, index=df.index[keep], copy=False)
+        self.__cache = read_only(df)
+        self.__indexes.clear()
+        self.updated += 1
+
+    def __set_column(self, column: str, rows: Any, values: Any) -> None:
+        """Replace the values of a column at the given rows.
+
+        Only the column is copied. The other columns are shared with
+        the previous dataframe, which existing views keep unchanged.
+
+        Parameters
+        ----------
+        `column` : `str`
+            The column to update.
+        `rows` : `Any`
+            The row labels (or slice) to update.
+        `values` : `Any`
+            The new values, as a scalar or a series aligned to `rows`.
+        """
+        updated = self.__cache[column].copy()
+        updated.loc[rows] = values
+        df = self.__cache.copy(deep=False)
+        df[column] = updated
+        self.__cache = read_only(df)
+        self.__indexes.pop(column, None)
+
+    def __get_masks(self, query: dict) -> dict[str, np.ndarray]:
+        """Return the row mask of each condition of the query.
+
+        Parameters
+        ----------
+        `query` : `dict`
+            A dictionary of query conditions.
+
+        Returns
+        -------
+        `dict[str, np.ndarray]`
+            The boolean row mask of each (non-empty) condition.
+        """
+
+        df = self.__cache
+        masks: dict[str, np.ndarray] = {}
+
+        for field, value in query.items():
+
+            is_blank = field in ("group", "from", "to") and not value
+
+            if value is None or is_blank:
+                continue
+
+            if field in ("from", "to"):
+                column = df["metadata.creation_datetime"]
+                timestamp = str(pd.to_datetime(value))
+                found = column >= timestamp if field == "from" \
+                    else column <= timestamp
+                masks[field] = found.to_numpy()
+                continue
+
+            is_many = isinstance(value, (list, tuple, set))
+            values = value if is_many else [value]
+
+            if field == "id":
+                masks[field] = df.index.isin(list(values))
+                continue
+
+            indexed = "metadata.groups" if field == "group" else field
+            index = self.__get_index(indexed)
+
+            mask = np.zeros(len(df), dtype=bool)
+            for v in values:
+                mask[index.get(v, [])] = True
+            masks[field] = mask
+
+        return masks
+
+    def __get_index(self, field: str) -> dict[Any, np.ndarray]:
+        """Return the index of the field, building it if missing.
+
+        Maps each value of the field to the positions of the rows
+        having it, in order of appearance. Set-valued fields (groups)
+        are indexed by each member.
+
+        Parameters
+        ----------
+        `field` : `str`
+            The dataframe column.
+
+        Returns
+        -------
+        `dict[Any, np.ndarray]`
+            The `{value: row_positions}` index of the field.
+        """
+        if field not in self.__indexes:
+            column = self.__cache[field].reset_index(drop=True)
+            if field == "metadata.groups":
+                column = column.explode().dropna()
+            grouped = column.groupby(column, sort=False, observed=True)
+            self.__indexes[field] = {
+                value: rows.to_numpy()
+                for value, rows in grouped.groups.items()
+            }
+        return self.__indexes[field]
+
     def __contains__(self, id: int) -> bool:
         return id in self.__raw
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, SamplesModel):
             return NotImplemented
-        return self.samples.equals(other.samples)
+        return self.view.equals(other.view)
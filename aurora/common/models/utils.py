@@ -128,6 +128,36 @@ def cast(v: int | float | str) -> int | float | str:
     return f"'{v}'" if isinstance(v, str) else v
 
 
+def read_only(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the dataframe backed by read-only column arrays.
+
+    Each column is held in its own array, such that a column can be
+    replaced without copying the others. Columns already backed by a
+    read-only array share it. Others are copied once and locked.
+
+    Writing into the returned dataframe, or into any shallow copy or
+    row selection sharing its arrays, raises a `ValueError`.
+
+    Parameters
+    ----------
+    `df` : `pd.DataFrame`
+        The dataframe to lock.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        A dataframe of the same data on read-only arrays.
+    """
+    columns = {}
+    for column in df.columns:
+        values = df[column].to_numpy()
+        if values.flags.writeable:
+            values = values.copy()
+            values.flags.writeable = False
+        columns[column] = values
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
 def style(df: pd.DataFrame) -> Styler:
     """Apply dataframe styles.
 
@@ -187,9 +187,11 @@ class Filters(ipw.Accordion):
             },
         }
 
-    def on_change(self, _=None) -> None:
+    def on_change(self, change: dict | None = None) -> None:
         """docstring"""
-        self.update_grid()
+        owner = change["owner"] if change else None
+        # a field's own options are unaffected by its selection
+        self.update_grid(skip=getattr(owner, "field", None))
         self.changed += 1
 
     def update(self, reset=False) -> None:
@@ -207,9 +209,9 @@ class Filters(ipw.Accordion):
         self.group.options = self.__model.get_group_labels()
 
     @silent
-    def update_grid(self) -> None:
+    def update_grid(self, skip: str | None = None) -> None:
         """docstring"""
-        self._build_grid_options()
+        self._build_grid_options(skip)
 
     def add_grid_filter(self, field: str, description: str) -> None:
         """docstring"""
@@ -226,39 +228,25 @@ class Filters(ipw.Accordion):
         for filter in self.grid_filters:
             filter.value = []
 
-    def _build_grid_options(self) -> None:
-        """docstring"""
-        for filter in self.grid_filters:
-            value = filter.value
-            filter.options = self._build_filter_options(filter.field)
-            filter.value = value
-
-    def _build_filter_options(
-        self,
-        field: str,
-    ) -> list[tuple[str, Any]]:
-        """docstring"""
+    def _build_grid_options(self, skip: str | None = None) -> None:
+        """Rebuild the options of the grid filters, other than `skip`.
 
-        if not self.__model.has_samples():
-            return []
+        Options are labeled with the number of samples matching the
+        current state of the other filters, all computed in one pass.
+        """
 
-        query = self.current_state
-        query.pop(field, None)
-        result = self.__model.query(query, project=[field])
+        filters = [f for f in self.grid_filters if f.field != skip]
 
-        value_counts = result[field].value_counts()
-
-        options_pairs: list[tuple[str, Any]] = []
-
-        result = self.__model.query({}, project=[field])
-
-        relevant_indexes = result[field].unique()
-
-        for index_label in relevant_indexes:
-            count = value_counts.get(index_label, 0)
-            options_pairs.append((f"{index_label} [{count}]", index_label))
+        facets = self.__model.get_facets(
+            self.current_state,
+            [filter.field for filter in filters],
+        )
 
-        return options_pairs
+        for filter in filters:
+            value = filter.value
+            filter.options = [(f"{option} [{count}]", option)
+                              for option, count in facets[filter.field]]
+            filter.value = value
 
     def _subscribe_observers(self) -> None:
         """docstring"""
@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 import ipywidgets as ipw
 
 from aurora.common.models import ProtocolsModel
@@ -152,7 +154,7 @@ class ProtocolsManager(ipw.VBox):
     def edit_protocol(self, _=None) -> None:
         """docstring"""
         protocol = self.local_model.get_protocol(self.selector.value)
-        self.editor.load_protocol(protocol)
+        self.editor.load_protocol(deepcopy(protocol))
 
     def sync_reset_with_save(self, _=None) -> None:
         """Sync the reset button with the save button state."""
@@ -187,7 +187,7 @@ class SamplesManager(ipw.VBox):
     def save_changes(self, _=None) -> None:
         """Synchronize sample models and persist samples."""
         # TODO can this be done more cleanly (at least move to model)
-        df = self.local_model.samples.reset_index()
+        df = self.local_model.view.reset_index()
         self.local_model.raw = pd_dataframe_to_formatted_json(df)
         self.samples_model.sync(self.local_model)
         self.samples_model.save()
@@ -1,14 +1,19 @@
+from pathlib import Path
+
 import ipywidgets as ipw
 from aiida.manage.configuration import load_profile
+from aiida_aurora.schemas.battery import BatterySample
 
 from aurora import __version__
 from aurora.common.models import ProtocolsModel, SamplesModel
-from aurora.common.models.backends import JSONBackend
+from aurora.common.models.backends import Backend, JSONBackend, SQLiteBackend
+from aurora.common.widgets.filters import FIELDS
 from aurora.experiment.builder import ExperimentBuilder
 from aurora.experiment.controller import ExperimentController
 from aurora.experiment.model import ExperimentModel
 from aurora.experiment.view import ExperimentView
 from aurora.inventory import InventoryManager
+from aurora.results.cache import AnalysisCache
 from aurora.results.model import ResultsModel
 from aurora.results.presenter import ResultsPresenter
 from aurora.results.view import ResultsView
@@ -16,6 +21,11 @@ from aurora.results.view import ResultsView
 DATA_DIR = "data"
 AVAILABLE_SAMPLES_FILE = "available_samples.json"
 AVAILABLE_PROTOCOLS_FILE = 'available_protocols.json'
+AVAILABLE_SAMPLES_DB = "available_samples.db"
+AVAILABLE_PROTOCOLS_DB = "available_protocols.db"
+USE_SQLITE = False
+ANALYSES_CACHE_DIR = "cache/analyses"
+MAX_ANALYSIS_WORKERS = 4
 
 MAIN_LAYOUT = {
     'width': '100%',
@@ -44,8 +54,18 @@ class MainPanel(ipw.VBox):
         "Results",
     )
 
-    def __init__(self) -> None:
-        """`MainPanel` constructor."""
+    def __init__(self, use_sqlite: bool = USE_SQLITE) -> None:
+        """`MainPanel` constructor.
+
+        Parameters
+        ----------
+        `use_sqlite` : `bool`
+            Whether samples and protocols are stored in SQLite rather
+            than in JSON, `USE_SQLITE` by default. A new SQLite database
+            is seeded from the JSON inventory.
+        """
+
+        self.use_sqlite = use_sqlite
 
         load_profile()
 
@@ -71,11 +91,11 @@ class MainPanel(ipw.VBox):
             The tab sections of the main panel.
         """
 
-        samples_backend = JSONBackend(DATA_DIR, AVAILABLE_SAMPLES_FILE)
+        samples_backend = self._build_samples_backend()
         samples_model = SamplesModel(samples_backend)
         samples_model.load()
 
-        protocols_backend = JSONBackend(DATA_DIR, AVAILABLE_PROTOCOLS_FILE)
+        protocols_backend = self._build_protocols_backend()
         protocols_model = ProtocolsModel(protocols_backend)
         protocols_model.load()
 
@@ -100,6 +120,81 @@ class MainPanel(ipw.VBox):
 
         return tabs
 
+    def _build_samples_backend(self) -> Backend:
+        """Build the samples backend.
+
+        Returns
+        -------
+        `Backend`
+            A SQLite backend indexing the filterable fields if
+            `use_sqlite` is set, a journaled JSON backend otherwise.
+        """
+        json_backend = JSONBackend(
+            DATA_DIR,
+            AVAILABLE_SAMPLES_FILE,
+            journal=True,
+            key="id",
+            schema=BatterySample,
+        )
+        if not self.use_sqlite:
+            return json_backend
+        sqlite_backend = SQLiteBackend(
+            DATA_DIR,
+            AVAILABLE_SAMPLES_DB,
+            key="id",
+            columns=[*SamplesModel.OPTIONS.values(), *FIELDS.values()],
+            schema=BatterySample,
+        )
+        return self._seed_backend(sqlite_backend, json_backend)
+
+    def _build_protocols_backend(self) -> Backend:
+        """Build the protocols backend.
+
+        Returns
+        -------
+        `Backend`
+            A SQLite backend if `use_sqlite` is set, a journaled JSON
+            backend otherwise.
+        """
+        json_backend = JSONBackend(
+            DATA_DIR,
+            AVAILABLE_PROTOCOLS_FILE,
+            journal=True,
+            key="name",
+        )
+        if not self.use_sqlite:
+            return json_backend
+        sqlite_backend = SQLiteBackend(
+            DATA_DIR,
+            AVAILABLE_PROTOCOLS_DB,
+            key="name",
+        )
+        return self._seed_backend(sqlite_backend, json_backend)
+
+    @staticmethod
+    def _seed_backend(
+        backend: SQLiteBackend,
+        source: JSONBackend,
+    ) -> SQLiteBackend:
+        """Seed a new SQLite backend from its JSON counterpart.
+
+        Parameters
+        ----------
+        `backend` : `SQLiteBackend`
+            The SQLite backend.
+        `source` : `JSONBackend`
+            The JSON backend of the same items.
+
+        Returns
+        -------
+        `SQLiteBackend`
+            The SQLite backend, holding the JSON items if it was new.
+        """
+        if not Path(backend.path).exists() and Path(source.path).exists():
+            backend.init()
+            backend.save(source.fetch())
+        return backend
+
     def __build_experiment_section(
         self,
         samples_model: SamplesModel,
@@ -122,7 +217,8 @@ class MainPanel(ipw.VBox):
         `ResultsView`
             The results view as an `ipw.VBox`.
         """
-        model = ResultsModel()
+        cache = AnalysisCache(f"{DATA_DIR}/{ANALYSES_CACHE_DIR}")
+        model = ResultsModel(cache, MAX_ANALYSIS_WORKERS)
         view = ResultsView()
         _ = ResultsPresenter(model, view)
         return view
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Iterator
+
+import numpy as np
+from aiida.orm import CalcJobNode
+
+fcntl: ModuleType | None
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+LOG_FILE = "log.txt"
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisCache():
+    """
+    A content-addressed on-disk store of cycling analysis results.
+
+    Entries are keyed by the node UUID and modification time. Each entry
+    is a directory holding one NumPy file per analysed array, which is
+    memory-mapped on read. Kernels plotting the same experiments thus
+    share the operating system's page cache rather than each holding
+    its own copy of the data.
+
+    The store is safe to share across sessions. Computing an entry
+    should be guarded with `lock`, such that only one process computes
+    it while the others wait and then read it.
+
+    Only sealed (terminated) nodes are cached. The total size of the
+    store is bounded, evicting the least recently used entries first.
+    """
+
+    def __init__(self, directory: str, max_size: int = 1024**3) -> None:
+        """`AnalysisCache` constructor.
+
+        Parameters
+        ----------
+        `directory` : `str`
+            The cache directory.
+        `max_size` : `int`
+            The maximum size of the cache in bytes, 1 GiB by default.
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_key(node: CalcJobNode) -> str | None:
+        """Return the cache key of the node.
+
+        Parameters
+        ----------
+        `node` : `CalcJobNode`
+            The experiment node.
+
+        Returns
+        -------
+        `str | None`
+            The cache key, `None` if the node is not yet sealed.
+        """
+        if not node.is_sealed:
+            return None
+        state = f"{node.uuid}:{node.mtime.isoformat()}"
+        return hashlib.sha256(state.encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[dict, str] | None:
+        """Return the cached analysis.
+
+        Parameters
+        ----------
+        `key` : `str`
+            The cache key.
+
+        Returns
+        -------
+        `tuple[dict, str] | None`
+            The analysed data as read-only memory-mapped arrays and the
+            analysis log, `None` if not cached.
+        """
+
+        path = self._get_path(key)
+
+        try:
+            log = (path / LOG_FILE).read_text()
+            data = {
+                file.stem: np.load(file, mmap_mode="r", allow_pickle=False)
+                for file in path.glob("*.npy")
+            }
+        except Exception:
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)  # mark as recently used
+
+        return data, log
+
+    def set(self, key: str, data: dict, log: str) -> None:
+        """Store the analysis in the cache.
+
+        The entry is first written to a temporary directory and then
+        atomically renamed, such that readers never see partial entries.
+        If another process stored the entry first, it is kept.
+
+        Parameters
+        ----------
+        `key` : `str`
+            The cache key.
+        `data` : `dict`
+            The analysed data arrays.
+        `log` : `str`
+            The analysis log.
+        """
+
+        path = self._get_path(key)
+        writer = f"{os.getpid()}.{threading.get_ident()}"
+        temp = self.directory / f"{key}.{writer}.tmp"
+
+        try:
+            temp.mkdir()
+            for name, array in data.items():
+                file = temp / f"{name}.npy"
+                np.save(file, np.asarray(array), allow_pickle=False)
+            (temp / LOG_FILE).write_text(log)
+            os.rename(temp, path)
+        except (OSError, ValueError) as err:
+            if not path.exists():
+                logger.warning("failed to cache analysis %s: %s", key, err)
+            shutil.rmtree(temp, ignore_errors=True)
+            return
+
+        self.evict()
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock on the entry across processes.
+
+        Locks are advisory (`flock`), and released by the operating
+        system if the holding process dies. The lock file is removed by
+        its holder on release, as waiters re-check the cache anyway.
+
+        Parameters
+        ----------
+        `key` : `str`
+            The cache key.
+        """
+
+        if fcntl is None:
+            yield
+            return
+
+        path = self.directory / f"{key}.lock"
+
+        with open(path, "a") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+    def evict(self) -> None:
+        """Discard least recently used entries exceeding the size limit."""
+
+        entries = []
+
+        for path in self.directory.iterdir():
+            if path.suffix == ".tmp" or not path.is_dir():
+                continue
+            with contextlib.suppress(OSError):
+                size = sum(file.stat().st_size for file in path.iterdir())
+                entries.append((path.stat().st_mtime, size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            # open memory maps of other processes remain valid
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Discard all entries, and lock files left by dead processes."""
+        for path in self.directory.iterdir():
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.suffix == ".lock":
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+    def _get_path(self, key: str) -> Path:
+        """Return the path of the cache entry."""
+        return self.directory / key
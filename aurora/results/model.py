@@ -1,16 +1,44 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-
+import json
+import zipfile
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from typing import Callable, Iterator
+
+import numpy as np
 import pandas as pd
+from aiida.manage import get_manager
 from aiida.orm import CalcJobNode, Group, QueryBuilder, load_node
 from aiida_aurora.calculations import BatteryCyclerExperiment
+from aiida_aurora.utils.cycling_analysis import cycling_analysis
 from traitlets import HasTraits, Unicode
 
 from aurora.common.groups import EXPERIMENTS_GROUP_PREFIX
 from aurora.time import TZ
 
-from .utils import get_experiment_sample_id, get_experiment_sample_node
+from .cache import AnalysisCache
+from .utils import (get_experiment_sample_id, get_experiment_sample_node,
+                    get_experiment_sample_nodes)
+
+PROJECTIONS = [
+    "id",
+    "label",
+    "ctime",
+    "mtime",
+    "attributes.process_state",
+    "extras.monitored",
+    "extras.flag",
+    "extras.status",
+]
+
+# tolerance for transactions committed after a later-stamped one
+SYNC_MARGIN = timedelta(minutes=5)
+
+# storage binding a session to each thread, safe to analyze from workers
+THREADED_STORAGE = ("core.psql_dos", )
 
 
 class ResultsModel(HasTraits):
@@ -20,12 +48,202 @@ class ResultsModel(HasTraits):
 
     weights_file = Unicode("")
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: AnalysisCache | None = None,
+        max_workers: int = 4,
+    ) -> None:
         """docstring"""
+        self.cache = cache
+        self.__max_workers = max_workers
         self.experiments = pd.DataFrame()
         self.results: dict[int, dict] = {}
+        self.page = 0
+        self.total = 0
+        self.__jobs: dict[str, pd.DataFrame] = {}
+        self.__synced: dict[str, tuple[date, datetime | None]] = {}
         self.weights: dict[int, dict[str, float]] = {}
 
+    @property
+    def max_workers(self) -> int:
+        """The number of experiments to analyze concurrently.
+
+        Analyses access the AiiDA storage, so they only run in worker
+        threads if the storage binds a session to each thread, one at a
+        time in the calling thread otherwise.
+
+        Returns
+        -------
+        `int`
+            The number of concurrent analyses.
+        """
+        profile = get_manager().get_profile()
+        if profile is None or profile.storage_backend not in THREADED_STORAGE:
+            return 1
+        return self.__max_workers
+
+    def analyze(self, eid: int) -> dict:
+        """Run the cycling analysis of the experiment.
+
+        The analysis is read from the cache if available, else stored
+        in it once computed. The cache is shared by all sessions, and
+        only one computes a given analysis while others wait for it.
+        Safe to call from worker threads.
+
+        Parameters
+        ----------
+        `eid` : `int`
+            The experiment id.
+
+        Returns
+        -------
+        `dict`
+            The analysed `data` arrays and the analysis `log`.
+        """
+
+        job_node = load_node(pk=eid)
+
+        cache = self.cache
+        key = cache.get_key(job_node) if cache is not None else None
+
+        if cache is None or not key:
+            data, log, _ = cycling_analysis(job_node)
+        elif cached := cache.get(key):
+            data, log = cached
+        else:
+            with cache.lock(key):
+                # another session may have stored it while waiting
+                if not (cached := cache.get(key)):
+                    data, log, _ = cycling_analysis(job_node)
+                    if data:
+                        cache.set(key, data, log)
+                    # memory-mapped, releasing the copy
+                    cached = cache.get(key) or (data, log)
+            data, log = cached
+
+        return {
+            "data": data,
+            "log": log,
+        }
+
+    def iter_analyses(
+        self,
+        eids: list[int],
+    ) -> Iterator[tuple[int, Future]]:
+        """Yield the analyses of the experiments as they complete.
+
+        Analyses run concurrently, at most twice the number of workers
+        ahead of the consumer, bounding the memory held by completed
+        but unconsumed analyses. Without concurrency (see
+        `max_workers`), each runs in the calling thread as it is
+        consumed. Session results are reused, but new analyses are not
+        stored in them.
+
+        Parameters
+        ----------
+        `eids` : `list[int]`
+            The experiment ids.
+
+        Yields
+        ------
+        `tuple[int, Future]`
+            The experiment id and its completed analysis future.
+        """
+
+        def get_analysis(eid: int) -> dict:
+            return self.results.get(eid) or self.analyze(eid)
+
+        max_workers = self.max_workers
+
+        if max_workers < 2:
+            for eid in eids:
+                future: Future = Future()
+                try:
+                    future.set_result(get_analysis(eid))
+                except Exception as err:
+                    future.set_exception(err)
+                yield eid, future
+            return
+
+        queue = iter(eids)
+        window = 2 * max_workers
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+
+            futures = {
+                pool.submit(get_analysis, eid): eid
+                for eid in islice(queue, window)
+            }
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield futures.pop(future), future
+                for eid in islice(queue, len(done)):
+                    futures[pool.submit(get_analysis, eid)] = eid
+
+    def export_experiments(
+        self,
+        eids: list[int],
+        path: str,
+        callback: Callable[[int, int], None] | None = None,
+    ) -> list[int]:
+        """Export the analyses of the experiments to a zip archive.
+
+        Each experiment is written as soon as its analysis completes,
+        under an `<eid>/` directory holding one NumPy file per analysed
+        array, the analysis log, the sample metadata, and the electrode
+        weights (as currently used for normalization).
+
+        Parameters
+        ----------
+        `eids` : `list[int]`
+            The experiment ids.
+        `path` : `str`
+            The archive file path.
+        `callback` : `Callable[[int, int], None] | None`
+            Called with the number of exported and total experiments
+            after each experiment, `None` by default.
+
+        Returns
+        -------
+        `list[int]`
+            The ids of the experiments without analysed data.
+        """
+
+        samples = get_experiment_sample_nodes(eids)
+
+        failed = []
+
+        with zipfile.ZipFile(path, "w") as archive:
+
+            analyses = self.iter_analyses(eids)
+
+            for done, (eid, future) in enumerate(analyses, 1):
+
+                try:
+                    analysis = future.result()
+                except Exception as err:
+                    analysis = {"data": {}, "log": f"ERROR! {err}"}
+
+                if not analysis["data"]:
+                    failed.append(eid)
+
+                sample = samples[eid].get_dict() if eid in samples else {}
+
+                write_experiment(
+                    archive,
+                    eid,
+                    analysis,
+                    sample,
+                    self.get_weights(eid),
+                )
+
+                if callback:
+                    callback(done, len(eids))
+
+        return sorted(failed)
+
     def get_weights(self, eid: int) -> dict[str, float]:
         """docstring"""
 
@@ -92,19 +310,161 @@ class ResultsModel(HasTraits):
         group: str,
         last_days: int,
         active_only: bool,
+        search: str = "",
+        page_size: int = 0,
     ) -> None:
-        """docstring"""
+        """Update the experiments table.
+
+        If `page_size` is non-zero, only the current page of matching
+        experiments is fetched, with all filtering done by AiiDA.
+        Otherwise, all matching experiments are held locally.
+
+        Parameters
+        ----------
+        `group` : `str`
+            The experiments group.
+        `last_days` : `int`
+            The time window in days.
+        `active_only` : `bool`
+            Whether to keep only active experiments.
+        `search` : `str`
+            An experiment label substring or id, empty by default.
+        `page_size` : `int`
+            The number of experiments per page, 0 (no paging) by default.
+        """
 
         group_label = f"{EXPERIMENTS_GROUP_PREFIX}/{group}"
-        if experiments := query_jobs(group_label, last_days, active_only):
-            df = pd.DataFrame(experiments).sort_values("id")
-            ctime = df["ctime"].dt.strftime(r"%Y-%m-%d %H:%m:%S")
-            df["ctime"] = ctime
+        since = datetime.now(TZ).date() - timedelta(days=last_days)
+
+        if page_size:
+            self.page = min(self.page, (self.total - 1) // page_size) \
+                if self.total else 0
+            jobs, self.total = query_jobs_page(
+                group_label,
+                since,
+                active_only,
+                search,
+                offset=self.page * page_size,
+                limit=page_size,
+            )
+            df = to_frame(jobs)
+        else:
+            self.page = 0
+            jobs = self.sync_jobs(group_label, since)
+            df = filter_jobs(jobs, since, active_only, search)
+            self.total = len(df)
+
+        if not df.empty:
+            df = df.sort_values("id")
+            ctime = df["ctime"].dt.strftime(r"%Y-%m-%d %H:%M:%S")
+            df = df.assign(ctime=ctime)
         else:
             df = pd.DataFrame()
 
         self.experiments = df
 
+    def sync_jobs(self, group: str, since: date) -> pd.DataFrame:
+        """Synchronize the local table of the group's experiments.
+
+        Only experiments modified since the last synchronization (less
+        `SYNC_MARGIN`, to catch late commits), or newly added to the
+        group, are fetched from AiiDA and merged in. Flag and extras
+        updates are caught as they bump the node modification time.
+        Experiments removed from the group (or deleted) are dropped.
+        A full fetch is performed on first access, or if the requested
+        time window extends beyond the synchronized one.
+
+        Parameters
+        ----------
+        `group` : `str`
+            The experiments group label.
+        `since` : `date`
+            The earliest creation date of the experiments.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The unfiltered experiments of the group, indexed by id.
+        """
+
+        jobs = self.__jobs.get(group)
+        synced_since, watermark = self.__synced.get(group, (since, None))
+
+        if jobs is None or since < synced_since:
+            jobs, synced_since, watermark = to_frame([]), since, None
+            new: list[int] = []
+        else:
+            members = query_job_ids(group, synced_since)
+            jobs = jobs[jobs.index.isin(members)]
+            new = list(members.difference(jobs.index))
+
+        modified_since = watermark - SYNC_MARGIN if watermark else None
+
+        if updates := query_jobs(group, synced_since, modified_since, new):
+            fresh = to_frame(updates)
+            fresh = fresh[~fresh.index.duplicated()]
+            jobs = jobs.drop(fresh.index, errors="ignore")
+            jobs = pd.concat([jobs, fresh]) if not jobs.empty else fresh
+            latest = fresh["mtime"].max().to_pydatetime()
+            watermark = latest if watermark is None else max(watermark, latest)
+
+        self.__jobs[group] = jobs
+        self.__synced[group] = (synced_since, watermark)
+
+        return jobs
+
+    def __update_flags(
+        self,
+        eids: list[int],
+        update: Callable[[str], dict | None],
+    ) -> None:
+        """Update the flag extras of the experiments in bulk.
+
+        All nodes are loaded in a single query and their extras are
+        written in a single transaction. The local experiments table, and
+        the synchronized tables it is filtered from, are patched in place
+        rather than re-queried.
+
+        Parameters
+        ----------
+        `eids` : `list[int]`
+            The experiment ids.
+        `update` : `Callable[[str], dict | None]`
+            Returns the extras to set given the current flag, or `None`
+            if the experiment is to be left as is.
+        """
+
+        if not eids:
+            return
+
+        nodes: list[CalcJobNode] = QueryBuilder().append(
+            BatteryCyclerExperiment,
+            filters={
+                "id": {
+                    "in": list(eids),
+                },
+            },
+        ).all(flat=True)
+
+        flags: dict[int, str] = {}
+
+        with get_manager().get_profile_storage().transaction():
+            for node in nodes:
+                flag: str = node.base.extras.get("flag", "") or ""
+                if extras := update(flag):
+                    node.base.extras.set_many(extras)
+                    flags[node.pk] = extras["flag"]
+
+        if not flags:
+            return
+
+        patched = pd.Series(flags)
+
+        for jobs in (self.experiments, *self.__jobs.values()):
+            if not jobs.empty:
+                rows = patched[patched.index.isin(jobs.index)]
+                jobs.loc[rows.index, "extras.flag"] = rows
+
     @staticmethod
     def get_groups() -> list[str]:
         """docstring"""
@@ -145,39 +505,115 @@ class ResultsModel(HasTraits):
         group = Group.collection.get_or_create(label)[0]
         group.add_nodes(nodes)
 
-    def schedule_monitor_kill_order(self, eid: int):
-        """docstring"""
-        node: CalcJobNode = load_node(eid)
-        flag: str = node.base.extras.get("flag", "")
-        if "🍅" in flag and "❌" not in flag:
-            node.base.extras.set_many({
-                "flag": f"{flag}❌",
-                "marked_for_death": True,
-            })
-
-    def cancel_monitor_kill_order(self, eid: int):
-        """docstring"""
-        node: CalcJobNode = load_node(eid)
-        flag: str = node.base.extras.get("flag", "")
-        if "❌" in flag:
-            node.base.extras.set_many({
-                "flag": flag.replace("❌", ""),
-                "marked_for_death": False,
-            })
+    def schedule_monitor_kill_orders(self, eids: list[int]) -> None:
+        """Mark the selected monitored experiments for termination."""
+
+        def schedule(flag: str) -> dict | None:
+            if "🍅" in flag and "❌" not in flag:
+                return {
+                    "flag": f"{flag}❌",
+                    "marked_for_death": True,
+                }
+            return None
+
+        self.__update_flags(eids, schedule)
+
+    def cancel_monitor_kill_orders(self, eids: list[int]) -> None:
+        """Cancel the termination of the selected experiments."""
+
+        def cancel(flag: str) -> dict | None:
+            if "❌" in flag:
+                return {
+                    "flag": flag.replace("❌", ""),
+                    "marked_for_death": False,
+                }
+            return None
+
+        self.__update_flags(eids, cancel)
 
     def get_experiment_extras(self, eid: int, field: str) -> str:
         """docstring"""
-        query = f"id == {eid}"
-        column = f"extras.{field}"
-        return self.experiments.query(query)[column].values[0]
+        return self.experiments.at[eid, f"extras.{field}"]
 
 
 def query_jobs(
     group: str,
-    last_days: int,
+    since: date,
+    modified_since: datetime | None = None,
+    include: list[int] | None = None,
+) -> list[dict]:
+    """Fetch the group's experiments created since the given date.
+
+    If `modified_since` is provided, only experiments modified since
+    then, or explicitly included, are fetched.
+    """
+
+    conditions: list[dict] = [{"ctime": {">=": since}}]
+
+    if modified_since is not None:
+
+        delta: list[dict] = [{"mtime": {">=": modified_since}}]
+
+        if include:
+            delta.append({"id": {"in": include}})
+
+        conditions.append({"or": delta})
+
+    qb = build_jobs_query(group, conditions, PROJECTIONS)
+    qb.order_by({"jobs": {"ctime": "desc"}})
+
+    return [query["jobs"] for query in qb.dict()]
+
+
+def query_jobs_page(
+    group: str,
+    since: date,
     active_only: bool,
-) -> list[BatteryCyclerExperiment]:
-    """docstring"""
+    search: str,
+    offset: int,
+    limit: int,
+) -> tuple[list[dict], int]:
+    """Fetch a page of the group's matching experiments.
+
+    Returns the page of experiments and the total number of matches.
+    """
+
+    conditions = [
+        {
+            "ctime": {
+                ">=": since
+            }
+        },
+        get_state_filters(active_only),
+    ]
+
+    if search:
+        conditions.append(get_search_filters(search))
+
+    qb = build_jobs_query(group, conditions, PROJECTIONS)
+    total = qb.count()
+
+    qb.order_by({"jobs": {"ctime": "desc"}})
+    qb.offset(offset)
+    qb.limit(limit)
+
+    return [query["jobs"] for query in qb.dict()], total
+
+
+def query_job_ids(group: str, since: date) -> set[int]:
+    """Fetch the ids of the group's experiments created since the
+    given date."""
+    conditions = [{"ctime": {">=": since}}]
+    qb = build_jobs_query(group, conditions, "id")
+    return set(qb.all(flat=True))
+
+
+def build_jobs_query(
+    group: str,
+    conditions: list[dict],
+    project: str | list[str],
+) -> QueryBuilder:
+    """Return a query of the group's experiments matching all conditions."""
 
     qb = QueryBuilder()
 
@@ -186,53 +622,123 @@ def query_jobs(
     qb.append(
         BatteryCyclerExperiment,
         with_group="g",
+        filters={"and": conditions},
         tag="jobs",
-        project=[
-            "id",
-            "label",
-            "ctime",
-            "attributes.process_state",
-            "extras.monitored",
-            "extras.flag",
-            "extras.status",
-        ],
+        project=project,
     )
 
-    qb.add_filter(
-        "jobs",
-        {
-            "ctime": {
-                ">=": datetime.now(TZ).date() - timedelta(days=last_days)
+    return qb
+
+
+def get_state_filters(active_only: bool) -> dict:
+    """Return the experiment state filters.
+
+    Active experiments are monitored and waiting. Otherwise, keep
+    finished experiments and any monitored ones.
+    """
+    return {
+        "and": [
+            {
+                "attributes.process_state": "waiting",
             },
-        },
-    )
+            {
+                "extras.monitored": True,
+            },
+        ],
+    } if active_only else {
+        "or": [
+            {
+                "attributes.process_state": "finished"
+            },
+            {
+                "extras.monitored": True,
+            },
+        ],
+    }
 
-    qb.add_filter(
-        "jobs",
-        {
-            "and": [
-                {
-                    "attributes.process_state": "waiting",
-                },
-                {
-                    "extras.monitored": True,
-                },
-            ],
-        } if active_only else {
-            "or": [
-                {
-                    "attributes.process_state": "finished"
-                },
-                {
-                    "extras.monitored": True,
-                },
-            ],
-        },
-    )
 
-    qb.order_by({"jobs": {"ctime": "desc"}})
+def get_search_filters(search: str) -> dict:
+    """Return filters matching an experiment label substring or id."""
+    conditions: list[dict] = [{"label": {"ilike": f"%{search}%"}}]
+    if search.isdigit():
+        conditions.append({"id": int(search)})
+    return {"or": conditions}
 
-    return [query["jobs"] for query in qb.dict()]
+
+def to_frame(jobs: list[dict]) -> pd.DataFrame:
+    """Return queried experiments as a dataframe indexed by id."""
+    df = pd.DataFrame(jobs, columns=PROJECTIONS)
+    return df.set_index("id", drop=False).rename_axis(None)
+
+
+def filter_jobs(
+    jobs: pd.DataFrame,
+    since: date,
+    active_only: bool,
+    search: str = "",
+) -> pd.DataFrame:
+    """Filter experiments locally by creation date, state, and
+    optionally by label substring or id.
+
+    Mirrors `get_state_filters` and `get_search_filters`.
+    """
+
+    if jobs.empty:
+        return jobs
+
+    state = jobs["attributes.process_state"]
+    monitored = jobs["extras.monitored"].eq(True)
+
+    if active_only:
+        mask = (state == "waiting") & monitored
+    else:
+        mask = (state == "finished") | monitored
+
+    start = datetime.combine(since, time(), TZ)
+    mask &= jobs["ctime"] >= start
+
+    if search:
+        label = jobs["label"].fillna("").astype(str)
+        found = label.str.contains(search, case=False, regex=False)
+        if search.isdigit():
+            found |= jobs["id"] == int(search)
+        mask &= found
+
+    return jobs[mask]
+
+
+def write_experiment(
+    archive: zipfile.ZipFile,
+    eid: int,
+    analysis: dict,
+    sample: dict,
+    weights: dict[str, float],
+) -> None:
+    """Write the experiment's analysis and metadata to the archive.
+
+    Parameters
+    ----------
+    `archive` : `zipfile.ZipFile`
+        The archive open for writing.
+    `eid` : `int`
+        The experiment id.
+    `analysis` : `dict`
+        The analysed `data` arrays and the analysis `log`.
+    `sample` : `dict`
+        The sample metadata.
+    `weights` : `dict[str, float]`
+        The electrode weights.
+    """
+
+    for name, array in analysis["data"].items():
+        if isinstance(array, dict):
+            continue  # plotting metadata, e.g. cached weights
+        with archive.open(f"{eid}/{name}.npy", "w", force_zip64=True) as f:
+            np.save(f, np.asarray(array), allow_pickle=False)
+
+    archive.writestr(f"{eid}/log.txt", analysis["log"])
+    archive.writestr(f"{eid}/sample.json", json.dumps(sample, default=str))
+    archive.writestr(f"{eid}/weights.json", json.dumps(weights))
 
 
 def fetch_weights_from_node(eid: int) -> dict[str, float]:
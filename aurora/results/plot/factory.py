@@ -18,6 +18,7 @@ class PlotPresenterFactory():
         plot_view: PlotView,
     ) -> PlotPresenter:
         """docstring"""
+        presenter: type[PlotPresenter]
         if plot_type == "current_time":
             presenter = presenters.CurrentTimePlotPresenter
         elif plot_type == "voltage_time":
@@ -32,10 +33,12 @@ class PlotPresenterFactory():
             presenter = presenters.CapacityCyclePlotPresenter
         elif plot_type == "capacity_swarm":
             presenter = presenters.CapacitySwarmPlotPresenter
+        elif plot_type == "capacity_summary":
+            presenter = presenters.CapacitySummaryPlotPresenter
         else:
-            presenter = PlotPresenter(plot_model, plot_view)
+            fallback = PlotPresenter(plot_model, plot_view)
             message = f"{plot_label} not yet implemented"
-            presenter.close_view(message=message)
-            return presenter
+            fallback.close_view(message=message)
+            return fallback
 
         return presenter(plot_model, plot_view)
@@ -1,13 +1,11 @@
 from __future__ import annotations
 
 import ipywidgets as ipw
-from aiida.orm import load_node
-from aiida_aurora.utils.cycling_analysis import cycling_analysis
+from aiida_aurora.utils.cycling_analysis import add_analysis
 from IPython.display import display
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
-from pandas.io.formats.style import Styler
 
 from ..model import ResultsModel
 
@@ -18,6 +16,9 @@ class PlotModel():
     """
     has_ax2 = False
 
+    RAW_COLUMNS = ("time", "I", "Ewe")
+    RAW_PAGE_SIZE = 100
+
     COLORS = {
         False: [
             "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b",
@@ -56,27 +57,29 @@ class PlotModel():
             handler=self.__reset_weights,
         )
 
+    @property
+    def max_workers(self) -> int:
+        """The number of experiments to analyze concurrently."""
+        return self.__results_model.max_workers
+
     def fetch_data(self, eid: int) -> None:
         """docstring"""
+        self.prefetch_data(eid)
+        self.data[eid] = self.__results_model.results[eid]["data"]
+        self.display_experiment_info(eid)
 
-        if eid in self.__results_model.results:
-            self.data[eid] = self.__results_model.results[eid]["data"]
-            self.display_experiment_info(eid)
-            return
+    def prefetch_data(self, eid: int) -> None:
+        """Run the cycling analysis, unless already available.
 
-        self.run_cycling_analysis(eid)
+        Safe to call from worker threads, as nothing is displayed.
+        """
+        if eid not in self.__results_model.results:
+            self.run_cycling_analysis(eid)
 
     def run_cycling_analysis(self, eid: int) -> None:
         """docstring"""
-        job_node = load_node(pk=eid)
-        data, log, raw = cycling_analysis(job_node)
-        self.__results_model.results[eid] = {
-            "data": data,
-            "log": log,
-            "raw": raw,
-        }
-        self.data[eid] = self.__results_model.results[eid]["data"]
-        self.display_experiment_info(eid)
+        results = self.__results_model.results
+        results[eid] = self.__results_model.analyze(eid)
 
     def get_weight(self, eid: int, electrode: str) -> int:
         """docstring"""
@@ -108,9 +111,8 @@ class PlotModel():
 
     def display_experiment_info(self, eid: int) -> None:
         """docstring"""
-        _, log, raw = self.__results_model.results[eid].values()
-        print(log, end="")
-        self.__add_raw_data_dropdown(raw)
+        print(self.__results_model.results[eid]["log"], end="")
+        self.__add_raw_data_dropdown(eid)
 
     ###########
     # PRIVATE #
@@ -122,13 +124,13 @@ class PlotModel():
             if eid in self.data and "weights" in self.data[eid]:
                 del self.data[eid]["weights"]
 
-    def __add_raw_data_dropdown(self, raw: Styler) -> None:
+    def __add_raw_data_dropdown(self, eid: int) -> None:
         """docstring"""
 
-        output = ipw.Output()
+        container = ipw.VBox()
 
         dropdown = ipw.Accordion(
-            children=[output],
+            children=[container],
             selected_index=None,
         )
 
@@ -137,19 +139,76 @@ class PlotModel():
         display(dropdown)
 
         dropdown.observe(
-            lambda change: self.__display_raw_data(change, output, raw),
+            lambda change: self.__display_raw_data(change, container, eid),
             "selected_index",
         )
 
     def __display_raw_data(
         self,
         change: dict,
-        output: ipw.Output,
-        raw: Styler,
+        container: ipw.VBox,
+        eid: int,
     ) -> None:
-        """docstring"""
-        if change["new"] == 0:
-            with output:
-                display(raw)
-        else:
+        """Display the raw data table of the experiment page by page.
+
+        The table is only built when the dropdown is opened, and is
+        discarded once closed.
+        """
+
+        if change["new"] != 0:
+            for widget in container.children:
+                widget.close()
+            container.children = []
+            return
+
+        data = self.__results_model.results[eid]["data"]
+        rows = len(data["time"]) if data else 0
+        pages = max(-(-rows // self.RAW_PAGE_SIZE), 1)
+
+        output = ipw.Output()
+
+        page = ipw.BoundedIntText(
+            layout={"width": "80px"},
+            min=1,
+            max=pages,
+            value=1,
+        )
+
+        previous_page = ipw.Button(
+            layout={"width": "fit-content"},
+            icon="chevron-left",
+        )
+
+        next_page = ipw.Button(
+            layout={"width": "fit-content"},
+            icon="chevron-right",
+        )
+
+        def show_page(_=None) -> None:
+            start = (page.value - 1) * self.RAW_PAGE_SIZE
+            end = start + self.RAW_PAGE_SIZE
+            page_data = {
+                key: data[key][start:end]
+                for key in self.RAW_COLUMNS
+            } if data else {}
             output.clear_output()
+            with output:
+                display(add_analysis(page_data))
+
+        def turn_page(step: int) -> None:
+            page.value = min(max(page.value + step, 1), pages)
+
+        page.observe(show_page, "value")
+        previous_page.on_click(lambda _: turn_page(-1))
+        next_page.on_click(lambda _: turn_page(1))
+
+        controls = ipw.HBox(children=[
+            previous_page,
+            page,
+            ipw.Label(f"of {pages} ({rows} rows)"),
+            next_page,
+        ])
+
+        container.children = [controls, output] if rows else [output]
+
+        show_page()
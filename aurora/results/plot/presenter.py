@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import ipywidgets as ipw
@@ -14,8 +15,9 @@ from traitlets import HasTraits, Unicode
 
 from aurora.time import TZ
 
-from ..utils import get_experiment_sample_node
+from ..utils import get_experiment_sample_node, get_experiment_sample_nodes
 from .model import PlotModel
+from .utils import write_series
 from .view import PlotView
 
 
@@ -39,6 +41,8 @@ class PlotPresenter(HasTraits):
 
     NORM_AX = ""
 
+    EXPORT_FORMATS = ("csv", "parquet", "h5")
+
     closing_message = Unicode("")
 
     def __init__(self, model: PlotModel, view: PlotView) -> None:
@@ -122,6 +126,34 @@ class PlotPresenter(HasTraits):
 
         return directory, prefix
 
+    def get_destination_format(self) -> str:
+        """Return the export format given by the selected filename."""
+        filename = self.view.file_explorer.selected_filename or ""
+        extension = filename.split(".")[-1].lower() if "." in filename else ""
+        return extension if extension in self.EXPORT_FORMATS else "csv"
+
+    def export_series(
+        self,
+        series: dict[str, tuple[np.ndarray, np.ndarray]],
+        suffix: str = "",
+    ) -> None:
+        """Write the series to the selected destination.
+
+        Falls back to CSV if the engine of the selected format is not
+        installed.
+        """
+
+        directory, prefix = self.get_destination_components()
+        path = f"{directory}/{prefix}{suffix}"
+        extension = self.get_destination_format()
+
+        try:
+            write_series(f"{path}.{extension}", series)
+        except ImportError as err:
+            with self.view.plot:
+                print(f"{err}\nExporting as CSV instead")
+            write_series(f"{path}.csv", series)
+
     def get_series_properties(self, eid: int) -> tuple[str, str | None]:
         """docstring"""
         label = self._get_series_label(eid)
@@ -233,20 +265,48 @@ class PlotPresenter(HasTraits):
         )
 
     def _fetch_data(self) -> None:
-        """docstring"""
+        """Fetch the experiments' data.
+
+        The analyses are first run concurrently, if the storage allows
+        it (see `ResultsModel.max_workers`). Logs and raw data are then
+        attached to the info tabs in selection order.
+        """
 
-        number_of_pages = int(np.ceil(len(self.model.experiment_ids) / 8))
+        experiment_ids = self.model.experiment_ids
+
+        # resolve all samples (series labels, weights) in a single query
+        get_experiment_sample_nodes(experiment_ids)
+
+        number_of_pages = int(np.ceil(len(experiment_ids) / 8))
 
         for i in range(number_of_pages):
             self._add_info_page(i)
 
-        for i, eid in enumerate(self.model.experiment_ids):
+        self._prefetch_data()
+
+        for i, eid in enumerate(experiment_ids):
             page_index = i // 8
             info_tab = self._add_info_tab(page_index, eid)
 
             with info_tab:
                 self.model.fetch_data(eid)
 
+    def _prefetch_data(self) -> None:
+        """Run the experiments' analyses in a thread pool.
+
+        Failed analyses are rerun by `fetch_data`, showing the error in
+        the experiment's info tab.
+        """
+
+        max_workers = self.model.max_workers
+
+        if max_workers < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for eid in self.model.experiment_ids:
+                pool.submit(self.model.prefetch_data, eid)
+
     def _add_info_page(self, index: int) -> None:
         """docstring"""
         self.view.info.children += (ipw.Tab(), )
@@ -1,4 +1,5 @@
 from .capacity_cycle import CapacityCyclePlotPresenter
+from .capacity_summary import CapacitySummaryPlotPresenter
 from .capacity_swarm import CapacitySwarmPlotPresenter
 from .current_time import CurrentTimePlotPresenter
 from .efficiency_cycle import EfficiencyCyclePlotPresenter
@@ -8,6 +9,7 @@ from .voltage_time import VoltageTimePlotPresenter
 
 __all__ = [
     "CapacityCyclePlotPresenter",
+    "CapacitySummaryPlotPresenter",
     "CapacitySwarmPlotPresenter",
     "CurrentTimePlotPresenter",
     "EfficiencyCyclePlotPresenter",
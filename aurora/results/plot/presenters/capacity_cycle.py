@@ -79,7 +79,15 @@ class CapacityCyclePlotPresenter(MultiSeriesPlotPresenter):
         y /= self.model.get_weight(eid, self.view.electrode.value)
         x, y = self._down_select(x, y)
         label, color = self.get_series_properties(eid)
-        line, = self.model.ax.plot(x, y, ".", label=label, color=color)
+        line = self.plot_line(
+            eid,
+            self.model.ax,
+            x,
+            y,
+            ".",
+            label=label,
+            color=color,
+        )
         self.store_color(line)
 
     ###################
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import ipywidgets as ipw
+import numpy as np
+import pandas as pd
+
+from ..model import PlotModel
+from ..view import PlotView
+from .capacity_swarm import CapacitySwarmPlotPresenter
+
+
+class CapacitySummaryPlotPresenter(CapacitySwarmPlotPresenter):
+    """
+    Per-cycle statistics of the discharge capacity across experiments.
+
+    Statistics are computed on an aligned cycle x experiment matrix and
+    drawn directly as boxes (5-95% whiskers) and bands (25-75% range,
+    median, and mean +/- std). The swarm is only overlaid for selections
+    of at most `SWARM_THRESHOLD` points, as its layout scales poorly.
+    """
+
+    TITLE = "Capacity Summary"
+
+    SWARM_THRESHOLD = 500
+
+    PERCENTILES = [5, 25, 50, 75, 95]
+
+    def __init__(
+        self,
+        model: PlotModel,
+        view: PlotView,
+    ) -> None:
+        """docstring"""
+
+        super().__init__(model, view)
+
+        draw_bands = ipw.Checkbox(
+            layout={},
+            description="show bands",
+            value=True,
+        )
+
+        self.add_controls({"draw_bands": draw_bands})
+
+        self.summary = pd.DataFrame()
+
+    def plot_series(self, eid: int, dataset: dict) -> None:
+        """docstring"""
+
+        data = self.extract_data(dataset)
+
+        if data.empty:
+            return
+
+        data = self._down_select(data)
+
+        self.summary = self._compute_summary(data)
+
+        positions = np.arange(len(self.summary))
+
+        if self.view.draw_box.value:
+            self._plot_boxes(positions)
+
+        if self.view.draw_bands.value:
+            self._plot_bands(positions)
+
+        has_few_points = len(data) <= self.SWARM_THRESHOLD
+        self.view.draw_swarm.disabled = not has_few_points
+
+        if has_few_points:
+            self._plot_swarmplot(data, draw=self.view.draw_swarm.value)
+
+        self.model.ax.set_xticks(positions)
+        self.model.ax.set_xticklabels(self.summary.index)
+
+    def download_data(self, _=None) -> None:
+        """docstring"""
+
+        directory, prefix = self.get_destination_components()
+        path = f"{directory}/{prefix}.csv"
+
+        with open(path, "w+") as file:
+            self.summary.to_csv(file)
+
+    ###########
+    # PRIVATE #
+    ###########
+
+    def _compute_summary(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Return the per-cycle statistics across experiments."""
+
+        cycles, rows = np.unique(data[self.X_LABEL], return_inverse=True)
+        _, columns = np.unique(data["eid"], return_inverse=True)
+
+        matrix = np.full((len(cycles), columns.max() + 1), np.nan)
+        matrix[rows, columns] = data[self.Y_LABEL].to_numpy()
+
+        percentiles = np.nanpercentile(matrix, self.PERCENTILES, axis=1)
+
+        summary = pd.DataFrame(
+            percentiles.T,
+            index=pd.Index(cycles, name=self.X_LABEL),
+            columns=[f"p{p}" for p in self.PERCENTILES],
+        )
+
+        summary.insert(0, "count", np.count_nonzero(~np.isnan(matrix), 1))
+        summary.insert(1, "mean", np.nanmean(matrix, axis=1))
+        summary.insert(2, "std", np.nanstd(matrix, axis=1))
+
+        return summary
+
+    def _plot_boxes(self, positions: np.ndarray) -> None:
+        """docstring"""
+
+        stats = [{
+            "whislo": row.p5,
+            "q1": row.p25,
+            "med": row.p50,
+            "q3": row.p75,
+            "whishi": row.p95,
+            "fliers": [],
+        } for row in self.summary.itertuples()]
+
+        self.model.ax.bxp(
+            stats,
+            positions=positions,
+            patch_artist=True,
+            manage_ticks=False,
+            showfliers=False,
+            boxprops=dict(
+                self.BOX_PROPS["boxprops"],
+                linewidth=self.BOX_PROPS["linewidth"],
+            ),
+            medianprops={"color": "black"},
+        )
+
+    def _plot_bands(self, positions: np.ndarray) -> None:
+        """docstring"""
+
+        ax = self.model.ax
+        summary = self.summary
+
+        ax.fill_between(
+            positions,
+            summary["p25"],
+            summary["p75"],
+            color="tab:blue",
+            alpha=0.2,
+            linewidth=0,
+            label="25-75%",
+        )
+
+        ax.plot(
+            positions,
+            summary["p50"],
+            color="tab:blue",
+            label="median",
+        )
+
+        ax.errorbar(
+            positions,
+            summary["mean"],
+            yerr=summary["std"],
+            fmt="o",
+            color="tab:orange",
+            markersize=3,
+            capsize=2,
+            label="mean ± std",
+        )
+
+    def _reset_plot(self) -> None:
+        """docstring"""
+        for container in [*self.model.ax.containers]:
+            container.remove()  # error bars
+        super()._reset_plot()
+
+    def _set_event_handlers(self) -> None:
+        """docstring"""
+
+        super()._set_event_handlers()
+
+        self.view.draw_bands.observe(
+            names="value",
+            handler=self.refresh,
+        )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import contextlib
+from collections import OrderedDict
+from typing import Any
 
 import ipywidgets as ipw
 import numpy as np
@@ -25,13 +27,16 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
 
     NORM_AX = "y"
 
-    BOX_PROPS = {
+    BOX_PROPS: dict[str, Any] = {
         "boxprops": {
             "facecolor": (0.25, 0.25, 0.25, 0.1),
         },
         "linewidth": 0.25,
     }
 
+    # the number of swarm datasets kept, least recently used out first
+    SWARM_CACHE_SIZE = 4
+
     HIDDEN_BOX_PROPS = {
         "boxprops": {
             "facecolor": "none",
@@ -117,8 +122,16 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
 
         self.add_controls(controls)
 
+        self.swarm_data: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+
     def extract_data(self, dataset: dict) -> pd.DataFrame:
-        """docstring"""
+        """Return the long-form swarm data of the experiments.
+
+        The data is cached per experiment set, number of cycles, and
+        normalization, such that toggling the display controls does not
+        rebuild it. Only the `SWARM_CACHE_SIZE` most recently used are
+        kept.
+        """
 
         max_cycle = self.__get_max_cycle(dataset)
 
@@ -128,29 +141,31 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
         self.view.num_cycles.max = max_cycle
         num_cycles = self.view.num_cycles.value
 
-        df_dict: dict[str, list] = {
-            self.X_LABEL: [],
-            "hue": [],
-            self.Y_LABEL: [],
+        electrode = self.view.electrode.value
+
+        factors = {
+            eid: 1 / self.model.get_weight(eid, electrode)
+            for eid in dataset
         }
 
-        for eid, data in dataset.items():
-            label, _ = self.get_series_properties(eid)
-            weight = self.model.get_weight(eid, self.view.electrode.value)
-            factor = 1 / weight
-            for cycle, capacity in zip(
-                    data["cycle-number"][:num_cycles],
-                    data["Qd"][:num_cycles],
-            ):
-                df_dict["hue"].append(label)
-                df_dict[self.X_LABEL].append(cycle)
-                df_dict[self.Y_LABEL].append(capacity * factor)
-
-        data = pd.DataFrame(df_dict)
-        data = data.sort_values([self.X_LABEL, "hue"])
-        data = data.astype({"hue": "str"})
+        key = (
+            tuple(factors.items()),
+            num_cycles,
+            self.view.sub_batch_toggle.value,
+        )
 
-        return data
+        if key in self.swarm_data:
+            self.swarm_data.move_to_end(key)
+        else:
+            self.swarm_data[key] = self._build_swarm_data(
+                dataset,
+                num_cycles,
+                factors,
+            )
+            while len(self.swarm_data) > self.SWARM_CACHE_SIZE:
+                self.swarm_data.popitem(last=False)
+
+        return self.swarm_data[key]
 
     def plot_series(self, eid: int, dataset: dict) -> None:
         """docstring"""
@@ -164,6 +179,38 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
     # PRIVATE #
     ###########
 
+    def _build_swarm_data(
+        self,
+        dataset: dict,
+        num_cycles: int,
+        factors: dict[int, float],
+    ) -> pd.DataFrame:
+        """docstring"""
+
+        eids, labels, cycles, capacities = [], [], [], []
+
+        for eid, data in dataset.items():
+            cycle = np.asarray(data["cycle-number"][:num_cycles])
+            capacity = np.asarray(data["Qd"][:num_cycles])
+            size = min(len(cycle), len(capacity))
+            label = self._get_series_label(eid)
+            eids.append(np.full(size, eid))
+            labels.append(np.full(size, label, dtype=object))
+            cycles.append(cycle[:size])
+            capacities.append(capacity[:size] * factors[eid])
+
+        data = pd.DataFrame({
+            self.X_LABEL: np.concatenate(cycles),
+            "hue": np.concatenate(labels),
+            self.Y_LABEL: np.concatenate(capacities),
+            "eid": np.concatenate(eids),
+        })
+
+        data = data.sort_values([self.X_LABEL, "hue"])
+        data = data.astype({"hue": "str"})
+
+        return data
+
     def _plot_boxplot(self, data: pd.DataFrame, draw=True) -> None:
         """docstring"""
         sns.boxplot(
@@ -189,11 +236,8 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
 
     def _get_swarm_copy(self, data: pd.DataFrame) -> pd.DataFrame:
         """docstring"""
-        swarm_data = data.copy(deep=True)
-        x_series = swarm_data[self.X_LABEL]
-        old_new_map = {old: new for new, old in enumerate(x_series.unique())}
-        swarm_data[self.X_LABEL] = x_series.apply(lambda old: old_new_map[old])
-        return swarm_data
+        positions, _ = pd.factorize(data[self.X_LABEL])
+        return data.assign(**{self.X_LABEL: positions})
 
     def __get_max_cycle(self, dataset: dict) -> int:
         """docstring"""
@@ -299,9 +343,9 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
             with contextlib.suppress(Exception):
                 step = int(args[2])
 
-        _range = list(np.array(range(max_cycle + 1))[start:end:step])
+        _range = np.arange(max_cycle + 1)[start:end:step]
 
-        return data.query(f"{self.X_LABEL} == {_range}") if _range else data
+        return self._select_cycles(data, _range)
 
     def _filter_points(self, data: pd.DataFrame) -> pd.DataFrame:
         """docstring"""
@@ -309,5 +353,15 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
         points = [int(p) for p in raw_list if p.strip("-").isnumeric()]
         max_cycle = data[self.X_LABEL].max() + 1
         valid = [p for p in set(points) if -max_cycle - 1 <= p < max_cycle]
-        _range = list(np.array(range(max_cycle))[valid])
-        return data.query(f"{self.X_LABEL} == {_range}") if _range else data
+        _range = np.arange(max_cycle)[valid]
+        return self._select_cycles(data, _range)
+
+    def _select_cycles(
+        self,
+        data: pd.DataFrame,
+        cycles: np.ndarray,
+    ) -> pd.DataFrame:
+        """docstring"""
+        if not cycles.size:
+            return data
+        return data[data[self.X_LABEL].isin(cycles)]
@@ -6,6 +6,8 @@ class CurrentTimePlotPresenter(MultiSeriesPlotPresenter):
     docstring
     """
 
+    DECIMATE = True
+
     TITLE = "I vs. t"
 
     X_LABEL = "t [h]"
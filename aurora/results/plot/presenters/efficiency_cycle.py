@@ -69,7 +69,15 @@ class EfficiencyCyclePlotPresenter(MultiSeriesPlotPresenter):
         x, y = (np.array(a) for a in self.extract_data(dataset))
         x, y = self._down_select(x, y)
         label, color = self.get_series_properties(eid)
-        line, = self.model.ax.plot(x, y, ".", label=label, color=color)
+        line = self.plot_line(
+            eid,
+            self.model.ax,
+            x,
+            y,
+            ".",
+            label=label,
+            color=color,
+        )
         self.store_color(line)
 
     ###################
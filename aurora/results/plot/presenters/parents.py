@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-from matplotlib.collections import PathCollection
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
 
+from ..model import PlotModel
 from ..presenter import PlotPresenter
+from ..utils import decimate
+from ..view import PlotView
 
 
 class MultiSeriesPlotPresenter(PlotPresenter):
@@ -11,6 +16,101 @@ class MultiSeriesPlotPresenter(PlotPresenter):
     docstring
     """
 
+    # draw x-sorted series decimated to the pixel width of the axes
+    DECIMATE = False
+
+    def __init__(self, model: PlotModel, view: PlotView) -> None:
+        """docstring"""
+
+        super().__init__(model, view)
+
+        # per-experiment lines, reused across refreshes
+        self.lines: dict[int, list[Line2D]] = {}
+        self.reusable: dict[int, list[Line2D]] = {}
+
+        self.full_data: dict[Line2D, tuple[np.ndarray, np.ndarray]] = {}
+        self.visible: dict[Line2D, tuple[int, int]] = {}
+
+        if self.DECIMATE:
+            self.model.ax.callbacks.connect(
+                "xlim_changed",
+                self._redecimate,
+            )
+
+    def plot_series(self, eid: int, dataset: dict) -> None:
+        """docstring"""
+        x, y = (np.array(a) for a in self.extract_data(dataset))
+        label, color = self.get_series_properties(eid)
+        line = self.plot_line(
+            eid,
+            self.model.ax,
+            x,
+            y,
+            label=label,
+            color=color,
+        )
+        self.store_color(line)
+
+    def plot_line(
+        self,
+        eid: int,
+        ax: Axes,
+        x: np.ndarray,
+        y: np.ndarray,
+        *args,
+        **kwargs,
+    ) -> Line2D:
+        """Plot a line of the experiment.
+
+        If refreshing, the experiment's existing line is updated in
+        place instead. The full-resolution data is kept for export and,
+        if the presenter decimates, to re-decimate the visible range
+        when the x-limits change.
+        """
+
+        full = (x, y)
+
+        if self.DECIMATE:
+            x, y = decimate(x, y, self._get_pixel_width())
+
+        if reusable := self.reusable.get(eid):
+            line = reusable.pop(0)
+            line.set_data(x, y)
+            if color := kwargs.get("color"):
+                line.set_color(color)
+            line.set_label(kwargs.get("label"))
+        else:
+            line, = ax.plot(x, y, *args, **kwargs)
+            self.lines.setdefault(eid, []).append(line)
+
+        self.full_data[line] = full
+
+        if self.DECIMATE:
+            self.visible[line] = (0, len(full[0]))
+
+        return line
+
+    def refresh(self, _=None, skip_x=False) -> None:
+        """Refresh the plot.
+
+        If the set of plotted experiments is unchanged, existing lines
+        are updated in place rather than torn down and re-plotted.
+        """
+
+        if self._has_same_series():
+            self.reusable = {eid: [*ls] for eid, ls in self.lines.items()}
+            try:
+                self.draw()
+            finally:
+                self.reusable = {}
+            self._update_plot_axes(axis="y" if skip_x else "both")
+            self._show_legend()
+        else:
+            super().refresh(skip_x=skip_x)
+
+        if self.DECIMATE:
+            self._redecimate(self.model.ax)
+
     def draw(self) -> None:
         """docstring"""
         with self.view.plot:
@@ -19,9 +119,11 @@ class MultiSeriesPlotPresenter(PlotPresenter):
                     self.plot_series(eid, dataset)
 
     def download_data(self, _=None) -> None:
-        """docstring"""
+        """Export the plotted series of each axes.
 
-        directory, prefix = self.get_destination_components()
+        Series are exported at full resolution, as extracted from the
+        model data with the current normalization and down-selection.
+        """
 
         axes = [self.model.ax]
 
@@ -29,20 +131,47 @@ class MultiSeriesPlotPresenter(PlotPresenter):
             axes.append(self.model.ax2)
 
         for i, ax in enumerate(axes, 1):
+            series: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+            for line in ax.lines:
+                x, y = self.full_data.get(line) or line.get_data()
+                series[str(line.get_label())] = (np.asarray(x), np.asarray(y))
+            self.export_series(series, suffix=f"_ax_{i}")
+
+    ###################
+    # PRIVATE METHODS #
+    ###################
+
+    def _get_pixel_width(self) -> int:
+        """Return the width of the plot area in pixels."""
+        return max(int(self.model.ax.bbox.width), 100)
 
-            suffix = f"ax_{i}.csv"
-            path = f"{directory}/{prefix}_{suffix}"
+    def _redecimate(self, ax: Axes) -> None:
+        """Re-decimate the full-resolution data in the visible range."""
 
-            plot = {line.get_label(): line.get_data() for line in ax.lines}
+        xmin, xmax = sorted(ax.get_xlim())
+        bins = self._get_pixel_width()
 
-            df = pd.DataFrame()
+        for line, (x, y) in self.full_data.items():
 
-            for series, (x, y) in plot.items():
-                new = pd.DataFrame({f"{series}_x": x, f"{series}_y": y})
-                df = pd.concat([df, new], axis=1)
+            start, end = np.searchsorted(x, (xmin, xmax))
+            visible = (max(start - 1, 0), min(end + 1, len(x)))
 
-            with open(path, "w+") as file:
-                df.to_csv(file, index=False)
+            if visible != self.visible[line]:
+                start, end = visible
+                line.set_data(*decimate(x[start:end], y[start:end], bins))
+                self.visible[line] = visible
+
+    def _has_same_series(self) -> bool:
+        """Check if the plotted experiments match the current data."""
+        plotted = {eid for eid, dataset in self.model.data.items() if dataset}
+        return bool(self.lines) and plotted == set(self.lines)
+
+    def _reset_plot(self) -> None:
+        """docstring"""
+        super()._reset_plot()
+        self.lines.clear()
+        self.full_data.clear()
+        self.visible.clear()
 
 
 class StatisticalPlotPresenter(PlotPresenter):
@@ -50,6 +179,10 @@ class StatisticalPlotPresenter(PlotPresenter):
     docstring
     """
 
+    def extract_data(self, dataset: dict) -> pd.DataFrame:
+        """docstring"""
+        raise NotImplementedError
+
     def draw(self) -> None:
         """docstring"""
         with self.view.plot:
@@ -57,52 +190,31 @@ class StatisticalPlotPresenter(PlotPresenter):
                 self.plot_series(0, self.model.data)
 
     def download_data(self, _=None) -> None:
-        """docstring"""
+        """Export the plotted data of each series.
 
-        directory, prefix = self.get_destination_components()
-        path = f"{directory}/{prefix}.csv"
+        The data is extracted from the model data with the current
+        normalization and down-selection.
+        """
 
-        ax = self.model.ax
+        data = self.extract_data(self.model.data)
 
-        handles, labels = ax.get_legend_handles_labels()
-        colors = [patch.get_facecolor() for patch in handles]
+        if not data.empty:
+            data = self._down_select(data)
 
-        legend_color_label_map: dict[str, str] = {
-            str(color[0]): label
-            for color, label in zip(colors, labels)
-        }
+        series = {
+            label: (
+                group[self.X_LABEL].to_numpy(),
+                group[self.Y_LABEL].to_numpy(),
+            )
+            for label, group in data.groupby("hue", sort=False)
+        } if not data.empty else {}
 
-        tick_mapping: dict[int, int] = {
-            text.get_position()[0]: int(text.get_text())
-            for text in ax.get_xticklabels()
-        }
+        self.export_series(series)
 
-        data_per_series: dict[str, list[list[int | float]]] = {
-            label: [[], []]  # [[x-coords], [y-coords]]
-            for label in labels
-        }
+    ###################
+    # PRIVATE METHODS #
+    ###################
 
-        collection: PathCollection
-        for collection in ax.collections:
-
-            if not isinstance(collection, PathCollection):
-                continue
-
-            colors = collection.get_facecolors()
-            offsets = collection.get_offsets()
-            x_coords = offsets[:, 0]
-            y_coords = offsets[:, 1]
-
-            for c, x, y in zip(colors, x_coords, y_coords):
-                label = legend_color_label_map[str(c)]
-                mapped_x = tick_mapping[int(round(x))]
-                data_per_series[label][0].append(mapped_x)
-                data_per_series[label][1].append(y)
-
-        df = pd.DataFrame()
-        for series, (x, y) in data_per_series.items():
-            new = pd.DataFrame({f"{series}_x": x, f"{series}_y": y})
-            df = pd.concat([df, new], axis=1).convert_dtypes()
-
-        with open(path, "w+") as file:
-            df.to_csv(file, index=False)
+    def _down_select(self, data: pd.DataFrame) -> pd.DataFrame:
+        """docstring"""
+        return data
@@ -56,7 +56,14 @@ class VoltageCapacityPlotPresenter(MultiSeriesPlotPresenter):
         x, y = (np.array(a) for a in self.extract_data(dataset))
         x /= self.model.get_weight(eid, self.view.electrode.value)
         label, color = self.get_series_properties(eid)
-        line, = self.model.ax.plot(x, y, label=label, color=color)
+        line = self.plot_line(
+            eid,
+            self.model.ax,
+            x,
+            y,
+            label=label,
+            color=color,
+        )
         self.store_color(line)
 
     ###################
@@ -8,6 +8,8 @@ class VoltageCurrentTimePlotPresenter(MultiSeriesPlotPresenter):
     docstring
     """
 
+    DECIMATE = True
+
     TITLE = "V & I vs. t"
 
     X_LABEL = "t [h]"
@@ -29,6 +31,21 @@ class VoltageCurrentTimePlotPresenter(MultiSeriesPlotPresenter):
         """docstring"""
         x, yv, yi = (np.array(a) for a in self.extract_data(dataset))
         label, color = self.get_series_properties(eid)
-        line, = self.model.ax.plot(x, yv, label=f"{label}:V", color=color)
-        self.model.ax2.plot(x, yi, "--", label=f"{label}:I", color=color)
+        line = self.plot_line(
+            eid,
+            self.model.ax,
+            x,
+            yv,
+            label=f"{label}:V",
+            color=color,
+        )
+        self.plot_line(
+            eid,
+            self.model.ax2,
+            x,
+            yi,
+            "--",
+            label=f"{label}:I",
+            color=color,
+        )
         self.store_color(line)
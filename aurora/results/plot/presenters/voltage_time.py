@@ -6,6 +6,8 @@ class VoltageTimePlotPresenter(MultiSeriesPlotPresenter):
     docstring
     """
 
+    DECIMATE = True
+
     TITLE = "V vs. t"
 
     X_LABEL = "t [h]"
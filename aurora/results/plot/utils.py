@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def decimate(
+    x: np.ndarray,
+    y: np.ndarray,
+    bins: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a series to a min/max envelope of `bins` buckets.
+
+    The series is split into consecutive buckets of equal point count.
+    Each bucket is represented by its minimum and maximum points (in
+    their original order), such that no peaks are lost when drawing.
+    The first and last points are always kept.
+
+    Parameters
+    ----------
+    `x` : `np.ndarray`
+        The x-coordinates, assumed sorted.
+    `y` : `np.ndarray`
+        The y-coordinates.
+    `bins` : `int`
+        The number of buckets, typically the pixel width of the axes.
+
+    Returns
+    -------
+    `tuple[np.ndarray, np.ndarray]`
+        The decimated series, at most ~`2 * bins` points long.
+    """
+
+    n = len(y)
+
+    if bins < 1 or n <= 2 * bins:
+        return x, y
+
+    chunk = int(np.ceil(n / bins))
+    size = (n // chunk) * chunk
+
+    blocks = y[:size].reshape(-1, chunk)
+    offsets = np.arange(0, size, chunk)
+
+    kept = [
+        [0, n - 1],
+        blocks.argmin(axis=1) + offsets,
+        blocks.argmax(axis=1) + offsets,
+    ]
+
+    if size < n:  # remaining partial bucket
+        tail = y[size:]
+        kept.append([size + tail.argmin(), size + tail.argmax()])
+
+    indices = np.unique(np.concatenate(kept))
+
+    return x[indices], y[indices]
+
+
+def write_series(
+    path: str,
+    series: dict[str, tuple[np.ndarray, np.ndarray]],
+    chunk_size: int = 100_000,
+) -> None:
+    """Write x/y series to file, in a format given by the path suffix.
+
+    CSV files hold side-by-side `<label>_x`/`<label>_y` columns, padded
+    with blanks, and are written in row chunks to bound memory. Parquet
+    (`.parquet`) and HDF5 (`.h5`) files hold a long-form table of
+    `series`, `x`, `y` columns, and require the optional `pyarrow` and
+    `tables` packages respectively.
+
+    Parameters
+    ----------
+    `path` : `str`
+        The destination file path.
+    `series` : `dict[str, tuple[np.ndarray, np.ndarray]]`
+        The x/y arrays of each series, by label.
+    `chunk_size` : `int`
+        The number of CSV rows written at once.
+
+    Raises
+    ------
+    `ImportError`
+        If the optional engine of the requested format is missing.
+    """
+
+    suffix = Path(path).suffix
+
+    if suffix in (".parquet", ".h5"):
+
+        df = pd.concat(
+            [
+                pd.DataFrame({
+                    "series": label,
+                    "x": x,
+                    "y": y,
+                }) for label, (x, y) in series.items()
+            ],
+            ignore_index=True,
+        ) if series else pd.DataFrame(columns=["series", "x", "y"])
+
+        if suffix == ".parquet":
+            df.to_parquet(path, index=False)
+        else:
+            df.to_hdf(path, key="data", mode="w", format="table")
+
+        return
+
+    columns = {
+        f"{label}_{axis}": np.asarray(array)
+        for label, xy in series.items() for axis, array in zip("xy", xy)
+    }
+
+    length = max((len(array) for array in columns.values()), default=0)
+
+    with open(path, "w+") as file:
+
+        pd.DataFrame(columns=list(columns)).to_csv(file, index=False)
+
+        for start in range(0, length, chunk_size):
+            end = start + chunk_size
+            chunk = pd.DataFrame({
+                name: pd.Series(array[start:end])
+                for name, array in columns.items()
+            })
+            chunk.to_csv(file, header=False, index=False)
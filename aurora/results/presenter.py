@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import threading
+from typing import Any, Callable
+
+import numpy as np
 
 from .model import ResultsModel
 from .plot.factory import PlotPresenterFactory
@@ -38,11 +43,45 @@ class ResultsPresenter():
             group=self.view.group_selector.value,
             last_days=self.view.last_days.value,
             active_only=self.view.active_check.value,
+            search=self.view.search.value.strip(),
+            page_size=self.view.page_size.value,
         )
 
         options = self._build_experiment_selector_options()
         self.view.experiment_selector.options = options
 
+        self.update_page_controls()
+
+    def update_page_controls(self) -> None:
+        """docstring"""
+
+        page_size = self.view.page_size.value
+        total = self.model.total
+        pages = max(int(np.ceil(total / page_size)), 1) if page_size else 1
+        page = self.model.page
+
+        self.view.page_label.value = f"{total} experiments"
+        if page_size:
+            self.view.page_label.value += f" | page {page + 1} of {pages}"
+
+        self.view.previous_page.disabled = page == 0
+        self.view.next_page.disabled = page >= pages - 1
+
+    def on_filters_change(self, _=None) -> None:
+        """Return to the first page of the updated experiments."""
+        self.model.page = 0
+        self.update_view_experiments()
+
+    def on_previous_page(self, _=None) -> None:
+        """docstring"""
+        self.model.page = max(self.model.page - 1, 0)
+        self.update_view_experiments()
+
+    def on_next_page(self, _=None) -> None:
+        """docstring"""
+        self.model.page += 1
+        self.update_view_experiments()
+
     def toggle_plot_button(self, _=None) -> None:
         """docstring"""
         no_experiments = not self.view.experiment_selector.value
@@ -54,6 +93,11 @@ class ResultsPresenter():
         no_experiments = not self.view.experiment_selector.value
         self.view.group_name.disabled = no_experiments
 
+    def toggle_export_button(self, _=None) -> None:
+        """docstring"""
+        no_experiments = not self.view.experiment_selector.value
+        self.view.export_button.disabled = no_experiments
+
     def toggle_group_name_button(self, _=None) -> None:
         """docstring"""
         self.view.group_add_button.disabled = not self.view.group_name.value
@@ -71,6 +115,63 @@ class ResultsPresenter():
         if self._has_valid_selection():
             self.add_plot_view()
 
+    def on_export_button_click(self, _=None) -> None:
+        """Export the selected experiments to a single archive.
+
+        If the storage allows analyzing off the main thread (see
+        `ResultsModel.max_workers`), the export runs in a background
+        thread, posting its progress to the kernel's event loop, such
+        that the kernel stays responsive and the progress bar updates.
+        """
+
+        self.view.info.clear_output()
+
+        eids = self.view.experiment_selector.value
+        chooser = self.view.export_filechooser
+        path = chooser.selected or f"{chooser.selected_path}/experiments.zip"
+
+        progress = self.view.export_progress
+        progress.max = len(eids)
+        progress.value = 0
+
+        in_background = self.model.max_workers > 1
+        loop = asyncio.get_event_loop() if in_background else None
+
+        def post(function: Callable[..., Any], *args: Any) -> None:
+            if loop is None:
+                function(*args)
+            else:
+                loop.call_soon_threadsafe(function, *args)
+
+        def update_progress(done: int, _: int) -> None:
+            post(setattr, progress, "value", done)
+
+        def finish(message: str) -> None:
+            self.view.export_button.disabled = False
+            self.display_info_message(message)
+
+        def export() -> None:
+            try:
+                failed = self.model.export_experiments(
+                    eids,
+                    path,
+                    update_progress,
+                )
+            except Exception as err:
+                message = f"Export failed: {err}"
+            else:
+                message = f"Exported {len(eids)} experiments to {path}"
+                if failed:
+                    message += f" (no data for {', '.join(map(str, failed))})"
+            post(finish, message)
+
+        self.view.export_button.disabled = True
+
+        if in_background:
+            threading.Thread(target=export, daemon=True).start()
+        else:
+            export()
+
     def on_group_add_button_click(self, _=None) -> None:
         """docstring"""
         label = self.view.group_name.value
@@ -142,30 +243,44 @@ class ResultsPresenter():
     def toggle_widgets(self, _=None) -> None:
         """docstring"""
         self.toggle_plot_button()
+        self.toggle_export_button()
         self.update_group_name_state()
 
     def schedule_monitor_kill_order(self, _=None) -> None:
         """docstring"""
-        for eid in self.view.experiment_selector.value:
-            self.model.schedule_monitor_kill_order(eid)
-        self.update_view_experiments()
+        eids = self.view.experiment_selector.value
+        self.model.schedule_monitor_kill_orders(eids)
+        self.update_experiment_selector()
 
     def cancel_monitor_kill_order(self, _=None) -> None:
         """docstring"""
-        for eid in self.view.experiment_selector.value:
-            self.model.cancel_monitor_kill_order(eid)
-        self.update_view_experiments()
+        eids = self.view.experiment_selector.value
+        self.model.cancel_monitor_kill_orders(eids)
+        self.update_experiment_selector()
+
+    def update_experiment_selector(self) -> None:
+        """Rebuild the selector options from the local experiments
+        table, preserving the current selection."""
+        selection = self.view.experiment_selector.value
+        options = self._build_experiment_selector_options()
+        self.view.experiment_selector.options = options
+        self.view.experiment_selector.value = selection
 
     def _set_event_handlers(self) -> None:
         """docstring"""
         self.view.on_displayed(self.update_view_experiments)
         self.view.plot_button.on_click(self.on_plot_button_clicked)
+        self.view.export_button.on_click(self.on_export_button_click)
         self.view.update_button.on_click(self.update_view_experiments)
         self.view.thumb_down.on_click(self.schedule_monitor_kill_order)
         self.view.thumb_up.on_click(self.cancel_monitor_kill_order)
-        self.view.active_check.observe(self.update_view_experiments, "value")
-        self.view.group_selector.observe(self.update_view_experiments, "value")
-        self.view.last_days.observe(self.update_view_experiments, "value")
+        self.view.active_check.observe(self.on_filters_change, "value")
+        self.view.group_selector.observe(self.on_filters_change, "value")
+        self.view.last_days.observe(self.on_filters_change, "value")
+        self.view.search.observe(self.on_filters_change, "value")
+        self.view.page_size.observe(self.on_filters_change, "value")
+        self.view.previous_page.on_click(self.on_previous_page)
+        self.view.next_page.on_click(self.on_next_page)
         self.view.experiment_selector.observe(self.toggle_widgets, "value")
         self.view.plot_type_selector.observe(self.toggle_plot_button, "value")
         self.view.weights_reset_button.on_click(self.reset_weights_file)
@@ -181,20 +296,27 @@ class ResultsPresenter():
         self.view.weights_reset_button.disabled = True
 
     def _build_experiment_selector_options(self) -> list[tuple]:
-        """Returns a (option_string, battery_id) list."""
-        return [(self._cast_row_as_option(row), row["id"])
-                for _, row in self.model.experiments.iterrows()]
-
-    def _cast_row_as_option(self, row: dict) -> str:
-        """docstring"""
-        pk = row["id"]
-        flag = self.model.get_experiment_extras(pk, "flag") or "❓"
-        label = row["label"] or "Experiment"
-        timestamp = row["ctime"]
-        option = f" {flag} {pk} : {label} : {timestamp}"
-        return option + f" : {status}" \
-            if (status := self.model.get_experiment_extras(pk, "status")) \
-            else option
+        """Returns a (option_string, battery_id) list.
+
+        Options are built column-wise in a single pass over the
+        experiments dataframe.
+        """
+
+        df = self.model.experiments
+
+        if df.empty:
+            return []
+
+        flag = df["extras.flag"].fillna("").astype(str).replace("", "❓")
+        label = df["label"].fillna("").astype(str).replace("", "Experiment")
+        timestamp = df["ctime"].astype(str)
+        status = df["extras.status"].fillna("").astype(str)
+
+        options = " " + flag + " " + df["id"].astype(str) + " : " + label
+        options += " : " + timestamp
+        options = options.where(status == "", options + " : " + status)
+
+        return list(zip(options, df["id"].tolist()))
 
     def _has_valid_selection(self) -> bool:
         """docstring"""
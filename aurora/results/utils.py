@@ -1,7 +1,19 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+
+from aiida.manage import get_manager
 from aiida.orm import QueryBuilder
 from aiida_aurora.calculations.cycler import BatteryCyclerExperiment
 from aiida_aurora.data.battery import BatterySampleData
 
+# experiment inputs are immutable, so the sample nodes are memoized by
+# (profile, eid), evicting the least recently used beyond the maximum
+MAX_SAMPLE_NODES = 5000
+SAMPLE_NODES: OrderedDict[tuple[str, int], BatterySampleData] = OrderedDict()
+SAMPLE_NODES_LOCK = Lock()
+
 
 def get_experiment_sample_id(eid: int) -> int:
     """docstring"""
@@ -20,8 +32,57 @@ def get_experiment_sample_name(eid: int) -> str:
 
 def get_experiment_sample_node(eid: int) -> BatterySampleData:
     """docstring"""
-    qb = QueryBuilder()
-    qb.append(BatteryCyclerExperiment, filters={"id": eid}, tag="exp")
-    qb.append(BatterySampleData, with_outgoing="exp")
-    sample_node, = qb.first()
-    return sample_node
+    return get_experiment_sample_nodes([eid])[eid]
+
+
+def get_experiment_sample_nodes(
+        eids: list[int]) -> dict[int, BatterySampleData]:
+    """Return the sample nodes of the given experiments.
+
+    Sample nodes not yet memoized are fetched in a single query. The
+    memo is scoped to the current profile, and bounded by
+    `MAX_SAMPLE_NODES`.
+
+    Parameters
+    ----------
+    `eids` : `list[int]`
+        The experiment ids.
+
+    Returns
+    -------
+    `dict[int, BatterySampleData]`
+        An `{eid: sample_node}` dictionary of the found sample nodes.
+    """
+
+    profile = get_manager().get_profile()
+    scope = profile.name if profile else ""
+
+    found: dict[int, BatterySampleData] = {}
+
+    with SAMPLE_NODES_LOCK:
+        for eid in eids:
+            if (scope, eid) in SAMPLE_NODES:
+                SAMPLE_NODES.move_to_end((scope, eid))
+                found[eid] = SAMPLE_NODES[(scope, eid)]
+
+    if missing := [eid for eid in eids if eid not in found]:
+        qb = QueryBuilder()
+        qb.append(
+            BatteryCyclerExperiment,
+            filters={"id": {
+                "in": missing
+            }},
+            project="id",
+            tag="exp",
+        )
+        qb.append(BatterySampleData, with_outgoing="exp", project="*")
+        fetched: dict[int, BatterySampleData] = dict(qb.all())
+        found.update(fetched)
+
+        with SAMPLE_NODES_LOCK:
+            for eid, node in fetched.items():
+                SAMPLE_NODES[(scope, eid)] = node
+            while len(SAMPLE_NODES) > MAX_SAMPLE_NODES:
+                SAMPLE_NODES.popitem(last=False)
+
+    return {eid: found[eid] for eid in eids if eid in found}
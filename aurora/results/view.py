@@ -30,6 +30,14 @@ class ResultsView(ipw.VBox):
 
     STATISTICAL_PLOT_TYPES = [
         ("Capacity swarm", "capacity_swarm"),
+        ("Capacity summary", "capacity_summary"),
+    ]
+
+    PAGE_SIZES = [
+        ("all", 0),
+        ("50", 50),
+        ("100", 100),
+        ("500", 500),
     ]
 
     def __init__(self) -> None:
@@ -59,6 +67,42 @@ class ResultsView(ipw.VBox):
             path=os.path.expanduser("~"),
         )
 
+        self.export_label = ipw.Label(
+            layout={
+                "width": "95px",
+                "margin": "0 6px 0 2px",
+                "padding": "0 0 0 24px",
+            },
+            value="Export to:",
+        )
+
+        self.export_button = ipw.Button(
+            layout=BUTTON_LAYOUT,
+            button_style="info",
+            icon="archive",
+            tooltip="Export selected experiments",
+            disabled=True,
+        )
+
+        self.export_filechooser = FileChooser(
+            layout={
+                "flex": "1",
+            },
+            path=os.path.expanduser("~"),
+            filename="experiments.zip",
+            select_default=True,
+        )
+
+        self.export_progress = ipw.IntProgress(
+            layout={
+                "width": "150px",
+                "margin": "0 6px",
+            },
+            min=0,
+            max=1,
+            value=0,
+        )
+
         self.group_selector = ipw.Dropdown(
             layout={
                 "width": "50%",
@@ -79,6 +123,43 @@ class ResultsView(ipw.VBox):
             description="Last days:",
         )
 
+        self.search = ipw.Text(
+            layout={
+                "width": "50%",
+            },
+            style={
+                "description_width": "95px",
+            },
+            description="Search:",
+            placeholder="Experiment label or id",
+            continuous_update=False,
+        )
+
+        self.page_size = ipw.Dropdown(
+            layout={
+                "width": "auto",
+            },
+            description="Per page:",
+            options=self.PAGE_SIZES,
+            value=0,
+        )
+
+        self.previous_page = ipw.Button(
+            layout=BUTTON_LAYOUT,
+            tooltip="Previous page",
+            icon="chevron-left",
+            disabled=True,
+        )
+
+        self.page_label = ipw.Label(layout={"margin": "0 6px"})
+
+        self.next_page = ipw.Button(
+            layout=BUTTON_LAYOUT,
+            tooltip="Next page",
+            icon="chevron-right",
+            disabled=True,
+        )
+
         self.experiment_selector = ipw.SelectMultiple(
             layout={
                 "width": "auto",
@@ -201,6 +282,18 @@ class ResultsView(ipw.VBox):
                         self.last_days,
                     ],
                 ),
+                ipw.HBox(
+                    layout={
+                        "align_items": "center",
+                    },
+                    children=[
+                        self.search,
+                        self.page_size,
+                        self.previous_page,
+                        self.page_label,
+                        self.next_page,
+                    ],
+                ),
                 ipw.HBox(
                     layout={
                         "margin": "5px 0",
@@ -212,6 +305,18 @@ class ResultsView(ipw.VBox):
                         self.weights_filechooser,
                     ],
                 ),
+                ipw.HBox(
+                    layout={
+                        "margin": "5px 0",
+                        "align_items": "center",
+                    },
+                    children=[
+                        self.export_label,
+                        self.export_button,
+                        self.export_filechooser,
+                        self.export_progress,
+                    ],
+                ),
                 self.experiment_selector,
                 selection_controls,
             ],
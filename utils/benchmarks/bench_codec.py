@@ -0,0 +1,108 @@
+"""Benchmark the encoding and decoding of the sample inventory.
+
+Times saving (encoding) and loading (decoding and restoring) a
+synthetic inventory with the schema codec, with `orjson` if installed
+and with the standard `json`, against the former pickle-based
+`PyObjEncoder` and `as_python_object` hooks.
+
+    python utils/benchmarks/bench_codec.py [--size 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pickle
+from datetime import datetime
+from typing import Any
+
+from aiida_aurora.schemas.battery import BatterySample
+from common import make_samples, measure, report
+
+from aurora.common.models.backends import codec
+from aurora.common.models.backends.codec import SchemaCodec
+
+
+def as_python_object(dictionary: dict) -> dict | object:
+    """Decode a dictionary as formerly, by object hook."""
+    if "set" in dictionary:
+        return set(dictionary["set"])
+    if "datetime" in dictionary:
+        return datetime.strptime(dictionary["datetime"], r"%Y-%m-%d %H:%M:%S")
+    if "_python_object" in dictionary:
+        return pickle.loads(dictionary["_python_object"].encode("latin-1"))
+    return dictionary
+
+
+class PyObjEncoder(json.JSONEncoder):
+    """The former encoder, pickling unknown types."""
+
+    def default(self, obj: object) -> dict | Any:
+        """Encode a non-JSON object as formerly."""
+        if isinstance(obj, set):
+            return {"set": list(obj)}
+        if isinstance(obj, datetime):
+            return {"datetime": str(obj)}
+        try:
+            return {"_python_object": pickle.dumps(obj).decode("latin-1")}
+        except pickle.PickleError:
+            return super().default(obj)
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    samples = make_samples(args.size)
+    schema_codec = SchemaCodec(BatterySample)
+
+    def schema_load(text: str) -> list[dict]:
+        items = schema_codec.loads(text)
+        return [schema_codec.restore(item) for item in items]
+
+    legacy = json.dumps(samples, cls=PyObjEncoder)
+    assert json.loads(legacy, object_hook=as_python_object) == samples
+    assert schema_load(legacy) == samples, "legacy file not restored"
+
+    report(
+        f"legacy save {args.size} samples",
+        measure(lambda: json.dumps(samples, cls=PyObjEncoder), repeat=3),
+    )
+    report(
+        f"legacy load {args.size} samples",
+        measure(
+            lambda: json.loads(legacy, object_hook=as_python_object),
+            repeat=3,
+        ),
+    )
+
+    engines = {"orjson": codec.orjson, "json": None}
+
+    for engine, module in engines.items():
+
+        if engine == "orjson" and module is None:
+            print("orjson is not installed")
+            continue
+
+        codec.orjson = module
+
+        text = schema_codec.dumps(samples)
+        assert schema_load(text) == samples, f"{engine} round trip differs"
+
+        report(
+            f"schema save {args.size} samples ({engine})",
+            measure(lambda: schema_codec.dumps(samples), repeat=3),
+        )
+        report(
+            f"schema load {args.size} samples ({engine})",
+            measure(lambda: schema_load(text), repeat=3),
+        )
+
+    codec.orjson = engines["orjson"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark the refresh of multi-series plots.
+
+Times refreshing a plot of synthetic voltage series, reusing its lines,
+against tearing them down and re-plotting them, with and without
+rendering the figure. AiiDA is not queried.
+
+    python utils/benchmarks/bench_plot_refresh.py [--series 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import matplotlib
+import numpy as np
+from common import measure, report
+
+from aurora.results.model import ResultsModel
+from aurora.results.plot.model import PlotModel
+from aurora.results.plot.presenter import PlotPresenter
+from aurora.results.plot.presenters.voltage_time import \
+    VoltageTimePlotPresenter
+from aurora.results.plot.view import PlotView
+
+
+class LocalVoltageTimePlotPresenter(VoltageTimePlotPresenter):
+    """A voltage plot labeling series without querying samples."""
+
+    def _get_series_label(self, eid: int) -> str:
+        """docstring"""
+        return f"sample-{eid}"
+
+
+def make_dataset(points: int, seed: int) -> dict:
+    """Return a synthetic cycling dataset."""
+    rng = np.random.default_rng(seed)
+    time = np.cumsum(rng.uniform(1, 10, points))
+    return {
+        "time": time,
+        "Ewe": 3.5 + 0.5 * np.sin(time / 3600) + rng.normal(0, 0.01, points),
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--series", type=int, default=50)
+    parser.add_argument("--points", type=int, default=20_000)
+    args = parser.parse_args()
+
+    matplotlib.use("Agg")
+
+    eids = list(range(1, args.series + 1))
+
+    results_model = ResultsModel()
+    model = PlotModel(results_model, eids)
+    model.data = {eid: make_dataset(args.points, eid) for eid in eids}
+
+    presenter = LocalVoltageTimePlotPresenter(model, PlotView())
+    presenter.draw()
+
+    def reuse() -> None:
+        presenter.refresh()
+
+    def rebuild() -> None:
+        PlotPresenter.refresh(presenter)
+
+    def render(refresh) -> None:
+        refresh()
+        model.fig.canvas.draw()
+
+    shape = f"{args.series} series of {args.points} points"
+
+    report(f"refresh, reusing lines, {shape}", measure(reuse))
+    report(f"refresh, re-plotting, {shape}", measure(rebuild))
+    report("refresh and render, reusing lines", measure(lambda: render(reuse)))
+    report("refresh and render, re-plotting", measure(lambda: render(rebuild)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark protocol lookups on a large protocol library.
+
+Times loading a synthetic protocol library, looking protocols up by
+name, querying, copying, and comparing models, with the stored
+validated models against the former re-validation of every protocol
+on each access.
+
+    python utils/benchmarks/bench_protocols.py [--size 3000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from aiida_aurora.schemas.cycling import (ConstantCurrent, ConstantVoltage,
+                                          ElectroChemSequence,
+                                          OpenCircuitVoltage)
+from common import measure, report
+
+from aurora.common.models import ProtocolsModel
+from aurora.common.models.utils import get_valid
+
+TECHNIQUES = (OpenCircuitVoltage, ConstantCurrent, ConstantVoltage)
+
+
+def make_protocols(size: int, steps: int = 6) -> list[dict]:
+    """Return `size` synthetic raw protocols of `steps` steps each."""
+    return [
+        ElectroChemSequence(
+            name=f"protocol-{i}",
+            method=[
+                TECHNIQUES[j % len(TECHNIQUES)](name=f"step-{i}-{j}")
+                for j in range(steps)
+            ],
+        ).dict() for i in range(size)
+    ]
+
+
+def legacy_models(model: ProtocolsModel) -> dict[str, ElectroChemSequence]:
+    """Return the protocol models as formerly, validated on each call."""
+    protocols = get_valid(model.raw, schema=ElectroChemSequence)
+    return {
+        protocol.name: protocol
+        for protocol in protocols if isinstance(protocol, ElectroChemSequence)
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=3000)
+    args = parser.parse_args()
+
+    raw = make_protocols(args.size)
+    model = ProtocolsModel()
+
+    start = time.perf_counter()
+    model.raw = raw
+    report(f"load {args.size} protocols", time.perf_counter() - start)
+
+    def reload() -> None:
+        model.raw = raw
+
+    report(f"reload {args.size} unchanged protocols", measure(reload))
+
+    names = [f"protocol-{i}" for i in range(0, args.size, args.size // 10)]
+
+    legacy = legacy_models(model)
+    assert model.query(names) == [legacy[name] for name in names]
+
+    report(
+        f"get {len(names)} protocols",
+        measure(lambda: [model.get_protocol(name) for name in names]),
+    )
+    report(
+        f"legacy get {len(names)} protocols",
+        measure(
+            lambda: [legacy_models(model).get(name) for name in names],
+            repeat=1,
+        ),
+    )
+
+    report(
+        f"query {len(names)} protocols by name",
+        measure(lambda: model.query(names)),
+    )
+    report(
+        f"legacy query {len(names)} protocols by name",
+        measure(
+            lambda: [legacy_models(model)[name] for name in names],
+            repeat=1,
+        ),
+    )
+
+    report("query all protocols", measure(lambda: model.query()))
+    report(
+        "legacy query all protocols",
+        measure(lambda: list(legacy_models(model).values()), repeat=3),
+    )
+
+    copy = model.copy()
+    assert copy == model, "copy differs"
+
+    def legacy_copy() -> ProtocolsModel:
+        copy = ProtocolsModel()
+        copy.raw = model.raw
+        return copy
+
+    report("copy model", measure(model.copy))
+    report("legacy copy model", measure(legacy_copy, repeat=1))
+    report("compare models", measure(lambda: copy == model))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark single-sample edits of the samples cache.
+
+Times updating, adding, and deleting one sample of a synthetic
+inventory with row-level cache maintenance, against the former full
+re-cache of the inventory after each edit.
+
+    python utils/benchmarks/bench_sample_edits.py [--size 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import time
+
+from aiida_aurora.schemas.battery import BatterySample
+from common import make_samples, measure, report
+
+from aurora.common.models import SamplesModel
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    model = SamplesModel()
+
+    start = time.perf_counter()
+    model.raw = make_samples(args.size)
+    model.cache()
+    report(f"load {args.size} samples", time.perf_counter() - start)
+
+    sample = model.models[args.size // 2].copy(deep=True)
+    sample.metadata.name = "renamed"
+
+    extra = make_samples(args.size + 100)[args.size:]
+    new = [BatterySample(**raw) for raw in extra]
+    added = iter(new)
+    deleted = iter(sample.id for sample in new)
+
+    def full_update() -> None:
+        model.update(sample, cache=False)
+        model.cache()
+
+    report("update one sample", measure(lambda: model.update(sample)))
+    report("full re-cache update", measure(full_update, repeat=3))
+
+    report("add one sample", measure(lambda: model.add(next(added))))
+    report("delete one sample", measure(lambda: model.delete(next(deleted))))
+
+    # the incremental edits leave the cache as a full re-cache would
+    incremental = model.view
+    model.cache()
+    assert incremental.equals(model.view), "incremental cache differs"
+
+    rest = list(itertools.islice(added, 3))
+
+    def full_add() -> None:
+        model.add(rest.pop(), cache=False)
+        model.cache()
+
+    report("full re-cache add", measure(full_add, repeat=3))
+
+    def full_delete() -> None:
+        model.delete(next(deleted), cache=False)
+        model.cache()
+
+    report("full re-cache delete", measure(full_delete, repeat=3))
+
+
+if __name__ == "__main__":
+    main()
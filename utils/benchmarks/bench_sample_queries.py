@@ -0,0 +1,114 @@
+"""Benchmark sample queries and filter option counts.
+
+Times the indexed sample queries and facets (the filter option counts)
+on a synthetic inventory, against the former `DataFrame.query` strings
+on a deep copy of the samples and a query per filter field.
+
+    python utils/benchmarks/bench_sample_queries.py [--size 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pandas as pd
+from common import make_samples, measure, report
+
+from aurora.common.models import SamplesModel
+from aurora.common.models.utils import to_pd_query
+from aurora.common.widgets.filters import FIELDS
+
+QUERIES = {
+    "batch": {
+        "metadata.batch": "batch-7",
+    },
+    "group and two specs": {
+        "group": "group-3",
+        "specs.manufacturer": "maker-3",
+        "specs.composition.cathode.formula": "C-1",
+    },
+    "date range and spec": {
+        "from": "2024-01-02",
+        "to": "2024-02-01",
+        "specs.manufacturer": "maker-1",
+    },
+}
+
+
+def legacy_query(model: SamplesModel, query: dict) -> pd.DataFrame:
+    """Return the samples as formerly queried, by query string."""
+    query = dict(query)
+    df = model.samples
+    if group := query.pop("group", None):
+        field = "metadata.groups"
+        df = df[df[field].apply(lambda groups: group in groups)]
+    return df.query(to_pd_query(query) or "id")
+
+
+def legacy_facets(model: SamplesModel, query: dict) -> dict[str, list]:
+    """Return the filter option counts as formerly computed."""
+    facets = {}
+    for field in FIELDS.values():
+        others = dict(query)
+        others.pop(field, None)
+        counts = legacy_query(model, others)[field].value_counts()
+        values = model.samples[field].unique()
+        facets[field] = [(value, counts.get(value, 0)) for value in values]
+    return facets
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    model = SamplesModel()
+
+    start = time.perf_counter()
+    model.raw = make_samples(args.size)
+    model.cache()
+    report(f"load {args.size} samples", time.perf_counter() - start)
+
+    for name, query in QUERIES.items():
+
+        found = model.query(dict(query))
+        legacy = legacy_query(model, query)
+        assert found.index.equals(legacy.index), f"{name} results differ"
+
+        report(
+            f"query {name} ({len(found)} found)",
+            measure(lambda: model.query(dict(query))),
+        )
+        report(
+            f"legacy query {name}",
+            measure(lambda: legacy_query(model, query), repeat=3),
+        )
+
+    query = QUERIES["group and two specs"]
+    fields = list(FIELDS.values())
+
+    facets = model.get_facets(dict(query), fields)
+    legacy = legacy_facets(model, query)
+    assert facets == legacy, "facets differ"
+
+    report(
+        f"facets of {len(fields)} filters",
+        measure(lambda: model.get_facets(dict(query), fields)),
+    )
+    report(
+        f"legacy facets of {len(fields)} filters",
+        measure(lambda: legacy_facets(model, query), repeat=1),
+    )
+
+    ids = list(range(1, args.size + 1, args.size // 100 or 1))
+    report(
+        f"get {len(ids)} samples by id",
+        measure(lambda: [model.get_sample(sid) for sid in ids]),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark the experiment selector of the results panel.
+
+Times the local update of the experiments table, that of a single page,
+and the selector options build, compared with the former row-by-row
+build, on a synthetic table of experiments. AiiDA is not queried.
+
+    python utils/benchmarks/bench_selector.py [--size 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+from common import measure, report
+
+import aurora.results.model as results
+from aurora.results.model import ResultsModel
+from aurora.results.presenter import ResultsPresenter
+from aurora.time import TZ
+
+STATES = ("finished", "waiting", "excepted")
+
+
+class LocalResultsModel(ResultsModel):
+    """A results model serving a local table of experiments."""
+
+    def __init__(self, jobs: pd.DataFrame) -> None:
+        """docstring"""
+        super().__init__()
+        self.jobs = jobs
+
+    def sync_jobs(self, group: str, since: date) -> pd.DataFrame:
+        """Return the local table, rather than synchronizing it."""
+        return self.jobs
+
+
+def make_jobs(size: int) -> list[dict]:
+    """Return `size` synthetic experiment projections."""
+    now = datetime.now(TZ)
+    return [{
+        "id": eid,
+        "label": f"experiment-{eid}" if eid % 10 else "",
+        "ctime": now - timedelta(hours=eid % 2000),
+        "mtime": now,
+        "attributes.process_state": STATES[eid % 3],
+        "extras.monitored": bool(eid % 2),
+        "extras.flag": "🟢" if eid % 4 else None,
+        "extras.status": "running" if eid % 5 == 0 else "",
+    } for eid in range(1, size + 1)]
+
+
+def legacy_options(experiments: pd.DataFrame) -> list[tuple]:
+    """Return the options as formerly built, one query per extra."""
+
+    def get_extras(eid: int, field: str):
+        query = experiments.query(f"id == {eid}")
+        return query[f"extras.{field}"].values[0]
+
+    options: list[tuple] = []
+    for _, row in experiments.iterrows():
+        pk = row["id"]
+        flag = get_extras(pk, "flag") or "❓"
+        label = row["label"] or "Experiment"
+        option = f" {flag} {pk} : {label} : {row['ctime']}"
+        if status := get_extras(pk, "status"):
+            option += f" : {status}"
+        options.append((option, pk))
+    return options
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--legacy-size", type=int, default=1_000)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.size)
+    frame = results.to_frame(jobs)
+
+    def query_jobs_page(
+        group: str,
+        since: date,
+        active_only: bool,
+        search: str,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[dict], int]:
+        return jobs[offset:offset + limit], len(jobs)
+
+    # serve the synthetic experiments in place of AiiDA
+    results.query_jobs_page = query_jobs_page
+    model = LocalResultsModel(frame)
+
+    def update(page_size: int) -> None:
+        model.update_experiments(
+            group="all",
+            last_days=365,
+            active_only=False,
+            page_size=page_size,
+        )
+
+    # the options build only needs the model, not the view
+    presenter = ResultsPresenter.__new__(ResultsPresenter)
+    presenter.model = model
+
+    def build() -> list[tuple]:
+        return presenter._build_experiment_selector_options()
+
+    report(
+        f"update table, all of {args.size} experiments",
+        measure(lambda: update(0)),
+    )
+    report(
+        f"update table, page of {args.page_size}",
+        measure(lambda: update(args.page_size)),
+    )
+
+    update(0)
+    shown = len(model.experiments)
+    report(f"build options, {shown} experiments", measure(build))
+
+    options = build()
+    model.experiments = model.experiments.head(args.legacy_size)
+    subset = model.experiments
+    legacy = legacy_options(subset)
+    assert legacy == options[:len(subset)], "options differ"
+
+    report(
+        f"build options, {len(subset)} experiments",
+        measure(build),
+    )
+    report(
+        f"legacy build options, {len(subset)} experiments",
+        measure(lambda: legacy_options(subset), repeat=1),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Shared helpers of the benchmark scripts."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+
+def measure(function: Callable[[], object], repeat: int = 5) -> float:
+    """Return the best wall time of the function, in seconds.
+
+    Parameters
+    ----------
+    `function` : `Callable[[], object]`
+        The function to time.
+    `repeat` : `int`
+        The number of runs, 5 by default.
+
+    Returns
+    -------
+    `float`
+        The shortest of the run times.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, seconds: float) -> None:
+    """Print the labeled time in milliseconds."""
+    print(f"{label:<52} {seconds * 1e3:10.2f} ms")
+
+
+def make_samples(size: int) -> list[dict]:
+    """Return `size` synthetic raw battery samples.
+
+    Samples spread over batches of 100, ten manufacturers, fifty
+    formulas per electrode, and twenty groups (each sample in two).
+
+    Parameters
+    ----------
+    `size` : `int`
+        The number of samples.
+
+    Returns
+    -------
+    `list[dict]`
+        The raw samples, with ids from 1.
+    """
+
+    start = datetime(2024, 1, 1)
+
+    def electrode(kind: str, i: int) -> dict:
+        return {
+            "formula": f"{kind}-{i % 50}",
+            "position": 1,
+            "diameter": {
+                "nominal": 10.0
+            },
+            "weight": {
+                "total": 20.0 + i % 7,
+                "collector": 5.0,
+                "net": 15.0 + i % 7,
+            },
+            "capacity": {
+                "nominal": 3.0
+            },
+        }
+
+    return [{
+        "id": i,
+        "specs": {
+            "case": "CR2032",
+            "manufacturer": f"maker-{i % 10}",
+            "composition": {
+                "anode": electrode("A", i),
+                "cathode": electrode("C", i // 3),
+                "electrolyte": {
+                    "formula": f"E-{i % 5}",
+                    "position": 1,
+                    "amount": 0.1,
+                },
+                "separator": {
+                    "name": f"S-{i % 3}",
+                    "diameter": {
+                        "nominal": 16.0
+                    },
+                },
+                "spacer": {
+                    "value": 1.0
+                },
+            },
+            "capacity": {
+                "nominal": 3.0
+            },
+        },
+        "metadata": {
+            "name": f"sample-{i}",
+            "groups": {"all-samples", f"group-{i % 20}"},
+            "batch": f"batch-{i // 100}",
+            "subbatch": str(i % 4),
+            "creation_datetime": start + timedelta(minutes=i),
+            "creation_process": "synthetic",
+        },
+    } for i in range(1, size + 1)]